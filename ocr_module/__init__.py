@@ -7,6 +7,7 @@ from .framework.resolver import (
     TranslateClient,
     PyMuPDFOcrClient,
     OCRClient,
+    translate_documents_pipelined,
 )
 from ocr_module.domain.entities import (
     Formula,
@@ -39,4 +40,5 @@ __all__ = [
     "TranslateClient",
     "PyMuPDFOcrClient",
     "OCRClient",
+    "translate_documents_pipelined",
 ]
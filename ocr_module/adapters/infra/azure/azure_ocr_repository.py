@@ -1,5 +1,4 @@
 import logging
-import os
 from logging import getLogger
 from typing import Dict, List, Tuple
 
@@ -102,6 +101,19 @@ class AzureOCRRepository(IOCRRepository):
             pages=self._analyze_result_to_pages(result, document_path),
             sections=self._analyze_result_to_sections(result, document_path),
         )
+        # セクション側のParagraphをページ側と同一インスタンスに差し替える。
+        # 重複エンティティ分のメモリを省けるうえ、後段の数式ID書き換えが
+        # ページ側の変更だけでセクションにも反映される前提を満たす。
+        paragraph_by_id = {
+            paragraph.paragraph_id: paragraph
+            for page in document.pages
+            for paragraph in page.paragraphs
+        }
+        for section in document.sections:
+            section.paragraphs = [
+                paragraph_by_id.get(paragraph.paragraph_id, paragraph)
+                for paragraph in section.paragraphs
+            ]
         usage_stats = OCRUsageStatsConfig(
             model_name=result.model_id, page_count=len(result.pages)
         )
@@ -128,10 +140,6 @@ class AzureOCRRepository(IOCRRepository):
     def _analyze_result_to_pages(
         self, result: AnalyzeResult, document_path: str
     ) -> List[Page]:
-        # ログディレクトリの設定
-        log_dir = "logs/ocr"
-        os.makedirs(log_dir, exist_ok=True)
-
         pages = result.pages
         paragraphs = result.paragraphs
         tables = result.tables
@@ -194,29 +202,8 @@ class AzureOCRRepository(IOCRRepository):
                 )
 
         pages_entity: List[Page] = []
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         for page_number, page in enumerate(pages, 1):
-            # ページごとのログファイルを設定
-            page_logger = getLogger(f"page_{page_number}")
-            page_logger.setLevel(logging.INFO)
-            for handler in page_logger.handlers:
-                page_logger.removeHandler(handler)
-
-            log_path = os.path.join(log_dir, f"page_{page_number}.log")
-            handler = logging.FileHandler(log_path, mode="w")
-            handler.setFormatter(
-                logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-            )
-            page_logger.addHandler(handler)
-
-            # ページの基本情報を記録
-            page_logger.debug(f"=== Page {page_number} Analysis ===")
-            page_logger.debug(
-                f"Page size: {page.width or 0.0}[{page.unit}]x{page.height or 0.0}[{page.unit}] inches\n"
-            )
-            if page.formulas is not None:
-                for formula in page.formulas:
-                    page_logger.debug(f"Formula: {formula.value}")
-
             # パラグラフ内の:formula:トークンを分析
             page_paragraphs = paragraphs_in_page[page_number]
             total_formula_tokens = sum(
@@ -226,25 +213,45 @@ class AzureOCRRepository(IOCRRepository):
             # 実際の数式の数を取得
             page_formulas = formulas_in_page[page_number]
 
-            page_logger.debug(f"Number of paragraphs: {len(page_paragraphs)}")
-            page_logger.debug(
-                f"Total :formula: tokens in paragraphs: {total_formula_tokens}"
-            )
-            page_logger.debug(f"Actual formulas available: {len(page_formulas)}")
+            # ページの解析内容を記録（DEBUG時のみ）
+            if debug_enabled:
+                self.logger.debug("=== Page %d Analysis ===", page_number)
+                self.logger.debug(
+                    "Page size: %s[%s]x%s[%s]",
+                    page.width or 0.0,
+                    page.unit,
+                    page.height or 0.0,
+                    page.unit,
+                )
+                if page.formulas is not None:
+                    for formula in page.formulas:
+                        self.logger.debug("Formula: %s", formula.value)
+                self.logger.debug(
+                    "Number of paragraphs: %d", len(page_paragraphs)
+                )
+                self.logger.debug(
+                    "Total :formula: tokens in paragraphs: %d",
+                    total_formula_tokens,
+                )
+                self.logger.debug(
+                    "Actual formulas available: %d", len(page_formulas)
+                )
+                for i, paragraph in enumerate(page_paragraphs):
+                    self.logger.debug(
+                        "Paragraph %d: %d :formula: tokens\nContent: %s",
+                        i,
+                        paragraph.content.count(":formula:"),
+                        paragraph.content,
+                    )
 
             # 不一致がある場合は警告
             if total_formula_tokens != len(page_formulas):
-                page_logger.warning(
-                    f"Mismatch between :formula: tokens ({total_formula_tokens}) "
-                    f"and available formulas ({len(page_formulas)})"
-                )
-
-            # 各パラグラフの詳細情報を記録
-            for i, paragraph in enumerate(page_paragraphs):
-                formula_count = paragraph.content.count(":formula:")
-                page_logger.debug(
-                    f"Paragraph {i}: {formula_count} :formula: tokens\n"
-                    f"Content: {paragraph.content}"
+                self.logger.warning(
+                    "Page %d: mismatch between :formula: tokens (%d) "
+                    "and available formulas (%d)",
+                    page_number,
+                    total_formula_tokens,
+                    len(page_formulas),
                 )
 
             # ページサイズをインチに変換
@@ -374,18 +381,25 @@ class AzureOCRRepository(IOCRRepository):
         figures_in_page: Dict[int, List[Figure]] = {
             i: [] for i in range(1, num_pages + 1)
         }
+        # bboxを先に計算し、画像抽出は一括APIに任せる
+        valid_figures: List[Tuple[int, DocumentFigure, int, Tuple[float, float, float, float]]] = []
         for idx, figure in enumerate(figures):
             if figure.bounding_regions is None:
                 continue
             page_number = figure.bounding_regions[0].page_number
-            image_data = self.image_extractor.extract_image(
-                pdf_path=document_path,
-                page_number=page_number,
-                inch_bbox=_get_bounding_box(
-                    figure.bounding_regions[0].polygon,
-                    pages[page_number - 1].unit or "pixel",
-                ),
+            bbox = _get_bounding_box(
+                figure.bounding_regions[0].polygon,
+                pages[page_number - 1].unit or "pixel",
             )
+            valid_figures.append((idx, figure, page_number, bbox))
+
+        image_data_list = self.image_extractor.extract_images(
+            document_path,
+            [(page_number, bbox) for _, _, page_number, bbox in valid_figures],
+        )
+        for (idx, figure, page_number, bbox), image_data in zip(
+            valid_figures, image_data_list
+        ):
             figure_element_ids: List[int] = []
             if figure.elements is not None:
                 figure_element_ids = [
@@ -393,10 +407,7 @@ class AzureOCRRepository(IOCRRepository):
                 ]
             figure_entity = Figure(
                 figure_id=idx,
-                bbox=_get_bounding_box(
-                    figure.bounding_regions[0].polygon,
-                    pages[page_number - 1].unit or "pixel",
-                ),
+                bbox=bbox,
                 page_number=page_number,
                 image_data=image_data,
                 element_paragraph_ids=figure_element_ids,
@@ -425,18 +436,25 @@ class AzureOCRRepository(IOCRRepository):
         tables_in_page: Dict[int, List[Table]] = {
             i: [] for i in range(1, num_pages + 1)
         }
+        # bboxを先に計算し、画像抽出は一括APIに任せる
+        valid_tables: List[Tuple[int, DocumentTable, int, Tuple[float, float, float, float]]] = []
         for idx, table in enumerate(tables):
             if table.bounding_regions is None:
                 continue
             page_number = table.bounding_regions[0].page_number
-            image_data = self.image_extractor.extract_image(
-                pdf_path=document_path,
-                page_number=page_number,
-                inch_bbox=_get_bounding_box(
-                    table.bounding_regions[0].polygon,
-                    pages[page_number - 1].unit or "pixel",
-                ),
+            bbox = _get_bounding_box(
+                table.bounding_regions[0].polygon,
+                pages[page_number - 1].unit or "pixel",
             )
+            valid_tables.append((idx, table, page_number, bbox))
+
+        image_data_list = self.image_extractor.extract_images(
+            document_path,
+            [(page_number, bbox) for _, _, page_number, bbox in valid_tables],
+        )
+        for (idx, table, page_number, bbox), image_data in zip(
+            valid_tables, image_data_list
+        ):
             table_element_ids: List[int] = []
             if table.cells is not None:
                 for cell in table.cells:
@@ -447,10 +465,7 @@ class AzureOCRRepository(IOCRRepository):
 
             table_entity = Table(
                 table_id=idx,
-                bbox=_get_bounding_box(
-                    table.bounding_regions[0].polygon,
-                    pages[page_number - 1].unit or "pixel",
-                ),
+                bbox=bbox,
                 page_number=page_number,
                 image_data=image_data,
                 element_paragraph_ids=table_element_ids,
@@ -1,5 +1,4 @@
 import os
-import time
 from logging import INFO, getLogger
 from typing import Any, Dict, List, Tuple
 
@@ -15,6 +14,7 @@ from ocr_module.domain.entities import (
 from ocr_module.domain.repositories.i_translate_section_repository import (
     ITranslateSectionRepository,
 )
+from ocr_module.utils import retry_transient
 
 
 class AzureOpenAITranslateSectionRepository(ITranslateSectionRepository):
@@ -150,32 +150,34 @@ class AzureOpenAITranslateSectionRepository(ITranslateSectionRepository):
         """
         Request translate from AzureOpenAI API
         """
-        retry_count = 0
-        while retry_count < self._retry_limit:
-            try:
-                response = self._client.chat.completions.create(
-                    model=self._model,
-                    messages=messages,
-                    max_tokens=4096,
-                    temperature=0.7,
-                    top_p=1.0,
-                )
-                return {
-                    "status": "success",
-                    "data": response.choices[0].message.content,
-                    "model_name": response.model,
-                    "input_tokens": (
-                        response.usage.prompt_tokens if response.usage else 0
-                    ),
-                    "output_tokens": (
-                        response.usage.completion_tokens if response.usage else 0
-                    ),
-                }
-            except Exception as e:
-                retry_count += 1
-                self._logger.warning(f"Failed to translate: {e}")
-                time.sleep(self._retry_delay)
-        raise Exception("Failed to translate")
+        def _do_request() -> Dict[str, Any]:
+            response = self._client.chat.completions.create(
+                model=self._model,
+                messages=messages,
+                max_tokens=4096,
+                temperature=0.7,
+                top_p=1.0,
+            )
+            return {
+                "status": "success",
+                "data": response.choices[0].message.content,
+                "model_name": response.model,
+                "input_tokens": (
+                    response.usage.prompt_tokens if response.usage else 0
+                ),
+                "output_tokens": (
+                    response.usage.completion_tokens if response.usage else 0
+                ),
+            }
+
+        # 429や5xxなどの一時的エラーだけを指数バックオフで再試行する。
+        # 認証エラー等は待っても回復しないため即時に失敗させる。
+        return retry_transient(
+            _do_request,
+            retry_limit=self._retry_limit,
+            initial_delay=self._retry_delay,
+            logger=self._logger,
+        )
 
     def translate_paragraphs(
         self,
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from logging import INFO, getLogger
 from typing import List, Tuple
 
@@ -14,6 +15,17 @@ from ocr_module.domain.repositories import ITranslateSectionRepository
 import deepl
 
 
+@lru_cache(maxsize=None)
+def _get_translator(api_key: str) -> deepl.Translator:
+    """APIキーごとにdeepl.Translatorを使い回す
+
+    Translatorは内部にHTTPセッションを持つため、リポジトリを作り直す
+    たびに新規構築するとTLSハンドシェイクをやり直すことになる。
+    プロセス内で同じキーのTranslatorを共有する。
+    """
+    return deepl.Translator(auth_key=api_key)
+
+
 class DeepLTranslateSectionRepository(ITranslateSectionRepository):
     def __init__(
         self,
@@ -22,7 +34,7 @@ class DeepLTranslateSectionRepository(ITranslateSectionRepository):
         glossary_id: str | None = None,
     ):
         deepl.http_client.max_network_retries = retry_limit
-        self._client = deepl.Translator(auth_key=api_key)
+        self._client = _get_translator(api_key)
         self._logger = getLogger(__name__)
         self._logger.setLevel(INFO)
         self._glossary_id = glossary_id
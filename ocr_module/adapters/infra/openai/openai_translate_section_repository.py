@@ -1,5 +1,4 @@
 import os
-import time
 from logging import INFO, StreamHandler, getLogger
 from typing import Any, Dict, List, Tuple
 
@@ -15,6 +14,7 @@ from ocr_module.domain.entities import (
 from ocr_module.domain.repositories.i_translate_section_repository import (
     ITranslateSectionRepository,
 )
+from ocr_module.utils import retry_transient
 
 
 class OpenAITranslateSectionRepository(ITranslateSectionRepository):
@@ -167,33 +167,35 @@ class OpenAITranslateSectionRepository(ITranslateSectionRepository):
         """
         Request translate from OpenAI API
         """
-        retry_count = 0
-        while retry_count < self.retry_limit:
-            try:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    max_tokens=4096,
-                    temperature=0.7,
-                    top_p=1.0,
-                )
-                translated_text = response.choices[0].message.content
-                self.logger.debug(translated_text)
-                return {
-                    "status": "success",
-                    "data": translated_text,
-                    "input_tokens": (
-                        response.usage.prompt_tokens if response.usage else 0
-                    ),
-                    "output_tokens": (
-                        response.usage.completion_tokens if response.usage else 0
-                    ),
-                }
-            except Exception as e:
-                retry_count += 1
-                self.logger.warning(f"Failed to translate: {e}")
-                time.sleep(self.retry_delay)
-        raise Exception("Failed to translate")
+        def _do_request() -> Dict[str, Any]:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=4096,
+                temperature=0.7,
+                top_p=1.0,
+            )
+            translated_text = response.choices[0].message.content
+            self.logger.debug(translated_text)
+            return {
+                "status": "success",
+                "data": translated_text,
+                "input_tokens": (
+                    response.usage.prompt_tokens if response.usage else 0
+                ),
+                "output_tokens": (
+                    response.usage.completion_tokens if response.usage else 0
+                ),
+            }
+
+        # 429や5xxなどの一時的エラーだけを指数バックオフで再試行する。
+        # 認証エラー等は待っても回復しないため即時に失敗させる。
+        return retry_transient(
+            _do_request,
+            retry_limit=self.retry_limit,
+            initial_delay=self.retry_delay,
+            logger=self.logger,
+        )
 
     def translate_paragraphs(
         self,
@@ -29,6 +29,14 @@ from ocr_module.domain.entities import (
 )
 from ocr_module.domain.repositories import IPDFGeneratorRepository
 
+# latexmkに渡す共通フラグ。nonstopmodeでプロンプト待ちを避けつつ、
+# halt-on-errorで最初のエラー時に即座に止めて失敗ページの無駄な
+# コンパイル続行を打ち切る（フォールバック生成に早く移れる）
+_COMPILER_ARGS = ["-interaction=nonstopmode", "-halt-on-error"]
+
+# escape_latex後の<formula_n/>プレースホルダ（アンダースコアは\_にエスケープされている）
+_FORMULA_ID_PATTERN = re.compile(r"<formula\\_(\d+)/>")
+
 
 class PyLaTeXGeneratePDFRepository(IPDFGeneratorRepository):
     def __init__(self):
@@ -127,7 +135,11 @@ class PyLaTeXGeneratePDFRepository(IPDFGeneratorRepository):
 
         # ドキュメントをPDFに変換
         try:
-            document.generate_pdf(output_path, clean_tex=False)
+            document.generate_pdf(
+                output_path,
+                clean_tex=False,
+                compiler_args=_COMPILER_ARGS,
+            )
         except Exception as e:
             self.logger.warning(f"Error generating PDF: {e}")
             raise e
@@ -210,7 +222,11 @@ class PyLaTeXGeneratePDFRepository(IPDFGeneratorRepository):
         document.append(NoEscape(r"\end{CJK}"))
 
         try:
-            document.generate_pdf(output_path, clean_tex=False)
+            document.generate_pdf(
+                output_path,
+                clean_tex=False,
+                compiler_args=_COMPILER_ARGS,
+            )
         except Exception as e:
             self.logger.warning(f"Error generating PDF: {e}")
             raise e
@@ -304,7 +320,7 @@ class PyLaTeXGeneratePDFRepository(IPDFGeneratorRepository):
             document.generate_pdf(
                 output_basename,
                 clean_tex=False,
-                compiler_args=["-interaction=nonstopmode"],
+                compiler_args=_COMPILER_ARGS,
             )
         except Exception as e:
             self.logger.warning(f"Error generating PDF: {e}")
@@ -330,43 +346,51 @@ class PyLaTeXGeneratePDFRepository(IPDFGeneratorRepository):
         self.paragraph_logger.debug(f"--------------------------------")
         current_formula_index = 0
         total_formulas = len(page_formulas)
+        paragraphs: List[Paragraph] = []
 
+        # 入力のParagraphは変更せず、変換結果は新しいエンティティとして返す
         for paragraph in page_paragraphs:
-            paragraph.content = escape_latex(paragraph.content)
-            num_formula = paragraph.content.count(":formula:")
-            if num_formula <= 0:
-                continue
+            content = escape_latex(paragraph.content)
+            num_formula = content.count(":formula:")
 
-            self.paragraph_logger.debug(f"num_formula: {num_formula}")
-            self.paragraph_logger.debug(
-                f"paragraph before replace: {paragraph.content}"
-            )
+            if num_formula > 0:
+                self.paragraph_logger.debug(f"num_formula: {num_formula}")
+                self.paragraph_logger.debug(f"paragraph before replace: {content}")
 
-            for i in range(num_formula):
-                if current_formula_index >= total_formulas:
-                    self.logger.warning(
-                        f"Not enough formulas ({total_formulas}) for all :formula: tokens in paragraphs"
+                for i in range(num_formula):
+                    if current_formula_index >= total_formulas:
+                        self.logger.warning(
+                            f"Not enough formulas ({total_formulas}) for all :formula: tokens in paragraphs"
+                        )
+                        break
+
+                    formula = page_formulas[current_formula_index]
+                    latex_value = formula.latex_value
+                    # もしformulaが不正なlatexの場合は警告する（eg. \begin{array}{}など）
+                    if r"\begin{array}{}" in latex_value:
+                        self.logger.warning(
+                            f"Warning: Invalid LaTeX formula: {latex_value}"
+                        )
+                        latex_value = "??"
+                    content = content.replace(f":formula:", f"${latex_value}$", 1)
+                    current_formula_index += 1
+                self.paragraph_logger.debug(f"paragraph after replace: {content}")
+                # もしまだ:formula:が残っていたらwarningを出す
+                if ":formula:" in content:
+                    self.paragraph_logger.warning(
+                        f"Warning: :formula: is still in the paragraph: {content}"
                     )
-                    break
 
-                formula = page_formulas[current_formula_index]
-                # もしformulaが不正なlatexの場合は警告する（eg. \begin{array}{}など）
-                if r"\begin{array}{}" in formula.latex_value:
-                    self.logger.warning(
-                        f"Warning: Invalid LaTeX formula: {formula.latex_value}"
-                    )
-                    formula.latex_value = "??"
-                paragraph.content = paragraph.content.replace(
-                    f":formula:", f"${formula.latex_value}$", 1
+            paragraphs.append(
+                Paragraph(
+                    paragraph_id=paragraph.paragraph_id,
+                    page_number=paragraph.page_number,
+                    content=content,
+                    role=paragraph.role,
+                    bbox=paragraph.bbox,
                 )
-                current_formula_index += 1
-            self.paragraph_logger.debug(f"paragraph after replace: {paragraph.content}")
-            # もしまだ:formula:が残っていたらwarningを出す
-            if ":formula:" in paragraph.content:
-                self.paragraph_logger.warning(
-                    f"Warning: :formula: is still in the paragraph: {paragraph.content}"
-                )
-        return page_paragraphs
+            )
+        return paragraphs
 
     def convert_paragraphs_with_translation_to_latex(
         self,
@@ -391,25 +415,22 @@ class PyLaTeXGeneratePDFRepository(IPDFGeneratorRepository):
         total_formulas = len(page_formulas)
         paragraphs: List[Paragraph] = []
 
+        # 入力のParagraphWithTranslationは変更しない
         for paragraph_with_translation in page_paragraphs_with_translation:
-            paragraph_with_translation.translation = escape_latex(
-                paragraph_with_translation.translation
-            )
-            num_formula = paragraph_with_translation.translation.count(":formula:")
+            translation = escape_latex(paragraph_with_translation.translation)
+            num_formula = translation.count(":formula:")
             if num_formula <= 0:
                 latex_paragraph = Paragraph(
                     paragraph_id=paragraph_with_translation.paragraph_id,
                     page_number=paragraph_with_translation.page_number,
-                    content=paragraph_with_translation.translation,
+                    content=translation,
                     role=paragraph_with_translation.role,
                     bbox=paragraph_with_translation.bbox,
                 )
                 paragraphs.append(latex_paragraph)
                 continue
             self.paragraph_logger.debug(f"num_formula: {num_formula}")
-            self.paragraph_logger.debug(
-                f"paragraph before replace: {paragraph_with_translation.translation}"
-            )
+            self.paragraph_logger.debug(f"paragraph before replace: {translation}")
 
             for i in range(num_formula):
                 if current_formula_index >= total_formulas:
@@ -419,24 +440,20 @@ class PyLaTeXGeneratePDFRepository(IPDFGeneratorRepository):
                     break
 
                 formula = page_formulas[current_formula_index]
-                paragraph_with_translation.translation = (
-                    paragraph_with_translation.translation.replace(
-                        f":formula:", f"${formula.latex_value}$", 1
-                    )
+                translation = translation.replace(
+                    f":formula:", f"${formula.latex_value}$", 1
                 )
                 current_formula_index += 1
-            self.paragraph_logger.debug(
-                f"paragraph after replace: {paragraph_with_translation.translation}"
-            )
+            self.paragraph_logger.debug(f"paragraph after replace: {translation}")
             # もしまだ:formula:が残っていたらwarningを出す
-            if ":formula:" in paragraph_with_translation.translation:
+            if ":formula:" in translation:
                 self.paragraph_logger.warning(
-                    f"Warning: :formula: is still in the paragraph: {paragraph_with_translation.translation}"
+                    f"Warning: :formula: is still in the paragraph: {translation}"
                 )
             latex_paragraph = Paragraph(
                 paragraph_id=paragraph_with_translation.paragraph_id,
                 page_number=paragraph_with_translation.page_number,
-                content=paragraph_with_translation.translation,
+                content=translation,
                 role=paragraph_with_translation.role,
                 bbox=paragraph_with_translation.bbox,
             )
@@ -468,36 +485,33 @@ class PyLaTeXGeneratePDFRepository(IPDFGeneratorRepository):
         formula_dict = {
             formula.formula_id: formula.latex_value for formula in page_formulas
         }
-        formula_pattern = re.compile(r"<formula\\_(\d+)/>")
+
+        def _replace_formula_id(match: "re.Match[str]") -> str:
+            formula_id = int(match.group(1))
+            if formula_id not in formula_dict:
+                return match.group(0)
+            self.paragraph_logger.debug(f"Replace formula_id: {formula_id}")
+            # もしformula_latexが\begin{array}{}を含んでいたら、不正な数式として扱う
+            if r"\begin{array}{}" in formula_dict[formula_id]:
+                formula_dict[formula_id] = formula_dict[formula_id].replace(
+                    r"\begin{array}{}", r"\begin{array}{l}"
+                )
+            return f"${formula_dict[formula_id]}$"
+
+        # 入力のParagraphWithTranslationは変更しない
         for paragraph_with_formula_id in page_paragraphs_with_formula_id:
-            paragraph_with_formula_id.translation = escape_latex(
-                paragraph_with_formula_id.translation
+            # <formula_{formula_id}/>を1回の走査でまとめて置換する
+            translation = _FORMULA_ID_PATTERN.sub(
+                _replace_formula_id,
+                escape_latex(paragraph_with_formula_id.translation),
             )
-            # <formula_{formula_id}/>が含まれていたら
-            formula_ids = formula_pattern.findall(paragraph_with_formula_id.translation)
-            self.paragraph_logger.debug(f"Hit formula_ids: {formula_ids}")
-            for formula_id in formula_ids:
-                if int(formula_id) in formula_dict:
-                    self.paragraph_logger.debug(f"Replace formula_id: {formula_id}")
-                    # もしformula_latexが\begin{array}{}を含んでいたら、不正な数式として扱う
-                    if r"\begin{array}{}" in formula_dict[int(formula_id)]:
-                        formula_dict[int(formula_id)] = formula_dict[
-                            int(formula_id)
-                        ].replace(r"\begin{array}{}", r"\begin{array}{l}")
-                    paragraph_with_formula_id.translation = (
-                        paragraph_with_formula_id.translation.replace(
-                            rf"<formula\_{formula_id}/>",
-                            f"${formula_dict[int(formula_id)]}$",
-                            1,
-                        )
-                    )
             self.paragraph_logger.debug(
-                f"paragraph_with_formula_id.translation: {paragraph_with_formula_id.translation}"
+                f"paragraph_with_formula_id.translation: {translation}"
             )
             latex_paragraph = Paragraph(
                 paragraph_id=paragraph_with_formula_id.paragraph_id,
                 page_number=paragraph_with_formula_id.page_number,
-                content=paragraph_with_formula_id.translation,
+                content=translation,
                 role=paragraph_with_formula_id.role,
                 bbox=paragraph_with_formula_id.bbox,
             )
@@ -18,6 +18,36 @@ class PyMuPDFGeneratePDFRepository(IPDFGeneratorRepository):
         self._logger = getLogger(__name__)
         self._logger.setLevel(INFO)
 
+
+    def _insert_page_images(self, pymupdf_page: pymupdf.Page, page) -> None:
+        """図・テーブル・ディスプレイ数式の画像をページに挿入する
+
+        image_dataを持たないエンティティ（PyMuPDF抽出由来など）はスキップする。
+        stream=Noneのままinsert_imageへ渡すとファイル名解釈にフォールバックして
+        失敗するため、ここで除外しておく。
+        """
+        for figure in page.figures:
+            if figure.image_data is not None:
+                pymupdf_page.insert_image(
+                    _convert_inch_bbox_to_pt(figure.bbox),
+                    stream=figure.image_data,
+                )
+        self._logger.debug(f"Inserted {len(page.figures)} figures")
+        for table in page.tables:
+            if table.image_data is not None:
+                pymupdf_page.insert_image(
+                    _convert_inch_bbox_to_pt(table.bbox),
+                    stream=table.image_data,
+                )
+        self._logger.debug(f"Inserted {len(page.tables)} tables")
+        for display_formula in page.display_formulas:
+            if display_formula.image_data is not None:
+                pymupdf_page.insert_image(
+                    _convert_inch_bbox_to_pt(display_formula.bbox),
+                    stream=display_formula.image_data,
+                )
+        self._logger.debug(f"Inserted {len(page.display_formulas)} display formulas")
+
     def generate_pdf(self, page: Page, output_path: str):
         """PDFを生成する
 
@@ -35,24 +65,7 @@ class PyMuPDFGeneratePDFRepository(IPDFGeneratorRepository):
                 text=paragraph.content,
             )
         self._logger.debug(f"Inserted {len(paragraphs)} paragraphs")
-        for figure in page.figures:
-            pymupdf_page.insert_image(
-                _convert_inch_bbox_to_pt(figure.bbox),
-                stream=figure.image_data,
-            )
-        self._logger.debug(f"Inserted {len(page.figures)} figures")
-        for table in page.tables:
-            pymupdf_page.insert_image(
-                _convert_inch_bbox_to_pt(table.bbox),
-                stream=table.image_data,
-            )
-        self._logger.debug(f"Inserted {len(page.tables)} tables")
-        for display_formula in page.display_formulas:
-            pymupdf_page.insert_image(
-                _convert_inch_bbox_to_pt(display_formula.bbox),
-                stream=display_formula.image_data,
-            )
-        self._logger.debug(f"Inserted {len(page.display_formulas)} display formulas")
+        self._insert_page_images(pymupdf_page, page)
         document.save(output_path, garbage=4, deflate=True, clean=True)
 
     def generate_pdf_with_translation(
@@ -68,24 +81,7 @@ class PyMuPDFGeneratePDFRepository(IPDFGeneratorRepository):
                 text=paragraph.translation,
             )
         self._logger.debug(f"Inserted {len(paragraphs)} paragraphs")
-        for figure in page.figures:
-            pymupdf_page.insert_image(
-                _convert_inch_bbox_to_pt(figure.bbox),
-                stream=figure.image_data,
-            )
-        self._logger.debug(f"Inserted {len(page.figures)} figures")
-        for table in page.tables:
-            pymupdf_page.insert_image(
-                _convert_inch_bbox_to_pt(table.bbox),
-                stream=table.image_data,
-            )
-        self._logger.debug(f"Inserted {len(page.tables)} tables")
-        for display_formula in page.display_formulas:
-            pymupdf_page.insert_image(
-                _convert_inch_bbox_to_pt(display_formula.bbox),
-                stream=display_formula.image_data,
-            )
-        self._logger.debug(f"Inserted {len(page.display_formulas)} display formulas")
+        self._insert_page_images(pymupdf_page, page)
         document.save(output_path, garbage=4, deflate=True, clean=True)
 
     def generate_pdf_with_formula_id(self, page: PageWithTranslation, output_path: str):
@@ -98,22 +94,5 @@ class PyMuPDFGeneratePDFRepository(IPDFGeneratorRepository):
                 text=paragraph.translation,
             )
         self._logger.debug(f"Inserted {len(paragraphs)} paragraphs")
-        for figure in page.figures:
-            pymupdf_page.insert_image(
-                _convert_inch_bbox_to_pt(figure.bbox),
-                stream=figure.image_data,
-            )
-        self._logger.debug(f"Inserted {len(page.figures)} figures")
-        for table in page.tables:
-            pymupdf_page.insert_image(
-                _convert_inch_bbox_to_pt(table.bbox),
-                stream=table.image_data,
-            )
-        self._logger.debug(f"Inserted {len(page.tables)} tables")
-        for display_formula in page.display_formulas:
-            pymupdf_page.insert_image(
-                _convert_inch_bbox_to_pt(display_formula.bbox),
-                stream=display_formula.image_data,
-            )
-        self._logger.debug(f"Inserted {len(page.display_formulas)} display formulas")
+        self._insert_page_images(pymupdf_page, page)
         document.save(output_path, garbage=4, deflate=True, clean=True)
@@ -1,16 +1,98 @@
+import os
+from collections import OrderedDict
 from logging import DEBUG, ERROR, INFO, getLogger
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import pymupdf
 
 from ocr_module.domain.entities import Figure
 from ocr_module.domain.repositories import IImageExtractorRepository
 
+# (パス, mtime_ns, サイズ)のドキュメント署名
+_DocumentSignature = Tuple[str, int, int]
+
 
 class PyMuPDFImageExtractor(IImageExtractorRepository):
+    # 開いたままにしておくドキュメント数と、抽出結果キャッシュの総バイト数上限
+    _DOCUMENT_CACHE_SIZE = 4
+    _IMAGE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
     def __init__(self):
         self.logger = getLogger(__name__)
         self.logger.setLevel(DEBUG)
+        self._documents: "OrderedDict[_DocumentSignature, pymupdf.Document]" = (
+            OrderedDict()
+        )
+        self._image_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._image_cache_bytes = 0
+
+    @staticmethod
+    def _document_signature(pdf_path: str) -> _DocumentSignature:
+        """ドキュメントのキャッシュキーを計算する
+
+        パスだけをキーにすると、同じパスに書き直されたファイル（使い回される
+        一時ファイル等）に対して古いハンドルや画像を返し続けるため、
+        mtimeとサイズを含めて同一性を判定する。
+
+        Args:
+            pdf_path: PDFファイルのパス
+
+        Returns:
+            _DocumentSignature: (パス, mtime_ns, サイズ)の署名
+        """
+        stat = os.stat(pdf_path)
+        return (pdf_path, stat.st_mtime_ns, stat.st_size)
+
+    def _get_document(self, signature: _DocumentSignature) -> pymupdf.Document:
+        """ドキュメントを開いてキャッシュする
+
+        1ドキュメントから図・テーブル・数式ごとにextract_imageが呼ばれるため、
+        呼び出しごとにopen/closeせず少数のドキュメントを開いたまま使い回す。
+
+        Args:
+            signature: ドキュメントの署名
+
+        Returns:
+            pymupdf.Document: 開いたドキュメント
+        """
+        document = self._documents.get(signature)
+        if document is not None:
+            self._documents.move_to_end(signature)
+            return document
+
+        document = pymupdf.open(signature[0])
+        self._documents[signature] = document
+        if len(self._documents) > self._DOCUMENT_CACHE_SIZE:
+            evicted_signature, evicted = self._documents.popitem(last=False)
+            evicted.close()
+            self._evict_document_images(evicted_signature)
+        return document
+
+    def _evict_document_images(self, signature: _DocumentSignature) -> None:
+        """追い出されたドキュメントの画像キャッシュを破棄する"""
+        for cache_key in [
+            key for key in self._image_cache if key[0] == signature
+        ]:
+            self._image_cache_bytes -= len(self._image_cache.pop(cache_key))
+
+    def _get_cached_image(self, cache_key: tuple) -> Optional[bytes]:
+        """画像キャッシュから引く（無ければNone）"""
+        image_data = self._image_cache.get(cache_key)
+        if image_data is not None:
+            self._image_cache.move_to_end(cache_key)
+        return image_data
+
+    def _store_image(self, cache_key: tuple, image_data: bytes) -> None:
+        """画像をキャッシュに登録し、総バイト数の上限を守るよう追い出す
+
+        ページ全面の図のPNGは1枚で数MBになり得るため、件数ではなく
+        総バイト数で上限を管理する。
+        """
+        self._image_cache[cache_key] = image_data
+        self._image_cache_bytes += len(image_data)
+        while self._image_cache_bytes > self._IMAGE_CACHE_MAX_BYTES:
+            _, evicted = self._image_cache.popitem(last=False)
+            self._image_cache_bytes -= len(evicted)
 
     def extract_image(
         self,
@@ -21,6 +103,9 @@ class PyMuPDFImageExtractor(IImageExtractorRepository):
         """
         指定された矩形領域から画像を抽出
 
+        同じ領域（例: ページをまたいで再出現する数式）は一度だけレンダリングし、
+        以降はキャッシュ済みのPNGバイト列を返す。
+
         Args:
             pdf_path: PDFファイルのパス
             figure: 画像の位置情報
@@ -30,8 +115,18 @@ class PyMuPDFImageExtractor(IImageExtractorRepository):
             None: 画像が見つからない場合
         """
         try:
-            doc = pymupdf.open(pdf_path)
-            page = doc.load_page(page_number - 1)
+            signature = self._document_signature(pdf_path)
+        except OSError as e:
+            self.logger.error(f"Failed to extract image: {e}")
+            return None
+
+        cache_key = (signature, page_number, tuple(inch_bbox))
+        cached = self._get_cached_image(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            page = self._get_document(signature).load_page(page_number - 1)
 
             # インチからポイントに変換
             bbox_pt = [x * 72 for x in inch_bbox]
@@ -40,11 +135,67 @@ class PyMuPDFImageExtractor(IImageExtractorRepository):
             matrix = pymupdf.Matrix(2.0, 2.0)  # 2倍に拡大
             pix = page.get_pixmap(clip=bbox_pt, matrix=matrix, dpi=300)  # DPIを指定
 
-            return pix.tobytes("png")  # PNG形式で出力
+            image_data = pix.tobytes("png")  # PNG形式で出力
 
         except Exception as e:
             self.logger.error(f"Failed to extract image: {e}")
             return None
 
-        finally:
-            doc.close()
+        # bytesは不変なのでキャッシュ共有しても安全
+        self._store_image(cache_key, image_data)
+        return image_data
+
+    def extract_images(
+        self,
+        pdf_path: str,
+        requests: List[Tuple[int, Tuple[float, float, float, float]]],
+    ) -> List[Optional[bytes]]:
+        """複数領域の画像をページ単位でまとめて抽出する
+
+        リクエストをページ番号でグルーピングし、ページのロードを領域間で
+        共有する。キャッシュ済みの領域はレンダリングせずに返す。
+
+        Args:
+            pdf_path: PDFファイルのパス
+            requests: (ページ番号, 画像の位置情報)のリスト
+
+        Returns:
+            List[Optional[bytes]]: requestsと同順の画像バイナリデータのリスト
+        """
+        results: List[Optional[bytes]] = [None] * len(requests)
+        try:
+            signature = self._document_signature(pdf_path)
+        except OSError as e:
+            self.logger.error(f"Failed to extract images: {e}")
+            return results
+
+        by_page: dict[int, List[Tuple[int, Tuple[float, float, float, float]]]] = {}
+        for index, (page_number, inch_bbox) in enumerate(requests):
+            by_page.setdefault(page_number, []).append((index, inch_bbox))
+
+        for page_number in sorted(by_page):
+            page = None
+            for index, inch_bbox in by_page[page_number]:
+                cache_key = (signature, page_number, tuple(inch_bbox))
+                cached = self._get_cached_image(cache_key)
+                if cached is not None:
+                    results[index] = cached
+                    continue
+
+                try:
+                    if page is None:
+                        page = self._get_document(signature).load_page(
+                            page_number - 1
+                        )
+                    bbox_pt = [x * 72 for x in inch_bbox]
+                    matrix = pymupdf.Matrix(2.0, 2.0)
+                    pix = page.get_pixmap(clip=bbox_pt, matrix=matrix, dpi=300)
+                    image_data = pix.tobytes("png")
+                except Exception as e:
+                    self.logger.error(f"Failed to extract image: {e}")
+                    continue
+
+                self._store_image(cache_key, image_data)
+                results[index] = image_data
+
+        return results
@@ -1,4 +1,8 @@
-from typing import Tuple, List, Dict, Any, Optional
+import copy
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple, List
 from ocr_module.domain.repositories import IOCRRepository
 from ocr_module.domain.entities import (
     Document,
@@ -9,8 +13,59 @@ from ocr_module.domain.entities import (
     Table,
     OCRUsageStatsConfig,
 )
+from ocr_module.utils import default_worker_count
 import pymupdf
-from logging import DEBUG, getLogger
+from logging import getLogger
+
+# TextPage生成フラグ。画像ブロックはbboxの取得にだけ使うので、
+# 合字・空白の保持と画像ブロックの列挙に必要な最小構成に固定する
+_TEXTPAGE_FLAGS = (
+    pymupdf.TEXT_PRESERVE_LIGATURES
+    | pymupdf.TEXT_PRESERVE_WHITESPACE
+    | pymupdf.TEXT_PRESERVE_IMAGES
+)
+
+# 各ワーカープロセスが開いたドキュメント（initializerで設定される）
+_worker_document = None
+
+
+def _init_worker(document_path: str) -> None:
+    """ワーカープロセスの初期化
+
+    ドキュメントをプロセスごとに一度だけ開く。MuPDFのプロセス内コンテキストの
+    初期化もここで済むため、最初のページ処理のレイテンシスパイクを避けられる。
+
+    Args:
+        document_path (str): ドキュメントのパス
+    """
+    global _worker_document
+    _worker_document = pymupdf.open(document_path)
+
+
+def _extract_page_elements(
+    page_number: int,
+) -> Tuple[int, float, float, List[Paragraph], List[Figure], List[Table]]:
+    """1ページ分の要素を抽出する（ワーカープロセス内で実行）
+
+    IDはページ内で0始まりの連番になるため、呼び出し側でオフセットを加算する。
+
+    Args:
+        page_number (int): ページ番号（1始まり）
+
+    Returns:
+        Tuple[int, float, float, List[Paragraph], List[Figure], List[Table]]:
+            ページ番号、ページ幅、ページ高さ、段落・図・テーブルのリスト
+    """
+    page = _worker_document[page_number - 1]
+    text_page = page.get_textpage(flags=_TEXTPAGE_FLAGS)
+    width = page.rect.width
+    height = page.rect.height
+    paragraphs, figures = PyMuPDFOCRRepository._get_paragraphs_figures_from_text_page(
+        text_page, width, height, page_number, 0, 0
+    )
+    tables = PyMuPDFOCRRepository._get_tables_from_page(page, page_number, 0)
+    return page_number, width, height, paragraphs, figures, tables
+
 
 class PyMuPDFOCRRepository(IOCRRepository):
     """PyMuPDFを使用したOCRリポジトリクラス
@@ -18,13 +73,63 @@ class PyMuPDFOCRRepository(IOCRRepository):
     PyMuPDFライブラリを使用してPDFや画像からテキストやテーブルなどの要素を抽出し、
     ドメインエンティティに変換するリポジトリ実装。
     """
+    # 内容ハッシュをキーにした解析結果キャッシュの保持件数
+    _DOCUMENT_CACHE_SIZE = 8
+
     def __init__(self):
+        # ログレベルはアプリ側のlogging設定に委ねる
         self._logger = getLogger(__name__)
-        self._logger.setLevel(DEBUG)  # DEBUGレベルに設定して詳細なログを出力
+        self._document_cache: "OrderedDict[str, Tuple[Document, OCRUsageStatsConfig]]" = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def _hash_document(document_path: str) -> str:
+        """ドキュメントの内容ハッシュを計算する
+
+        Args:
+            document_path (str): ドキュメントのパス
+
+        Returns:
+            str: SHA-256ハッシュの16進文字列
+        """
+        digest = hashlib.sha256()
+        with open(document_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
 
     def get_document(self, document_path: str) -> Tuple[Document, OCRUsageStatsConfig]:
         """ドキュメントを取得する
 
+        同一内容のドキュメントは内容ハッシュをキーに解析結果をキャッシュし、
+        再OCRを省略する。呼び出し側がエンティティを変更しても安全なように、
+        キャッシュからはdeep copyを返す。
+
+        Args:
+            document_path (str): ドキュメントのパス
+
+        Returns:
+            Tuple[Document, OCRUsageStatsConfig]: ドキュメントと使用統計情報
+        """
+        content_hash = self._hash_document(document_path)
+        cached = self._document_cache.get(content_hash)
+        if cached is not None:
+            self._document_cache.move_to_end(content_hash)
+            self._logger.debug("ドキュメントキャッシュにヒットしました: %s", document_path)
+            return copy.deepcopy(cached)
+
+        result = self._parse_document(document_path)
+        self._document_cache[content_hash] = copy.deepcopy(result)
+        if len(self._document_cache) > self._DOCUMENT_CACHE_SIZE:
+            self._document_cache.popitem(last=False)
+        return result
+
+    def _parse_document(
+        self, document_path: str
+    ) -> Tuple[Document, OCRUsageStatsConfig]:
+        """ドキュメントを解析してエンティティを構築する
+
         Args:
             document_path (str): ドキュメントのパス
 
@@ -32,36 +137,49 @@ class PyMuPDFOCRRepository(IOCRRepository):
             Tuple[Document, OCRUsageStatsConfig]: ドキュメントと使用統計情報
         """
 
-        # 1. ドキュメントを開く
-        document = pymupdf.open(document_path)
-        self._logger.debug(f"ドキュメントを開きました: {document_path}, ページ数: {len(document)}")
+        # 1. ドキュメントを開く（閉じ忘れを防ぐためスコープを区切る）
+        with pymupdf.open(document_path) as document:
+            return self._parse_open_document(document, document_path)
+
+    def _parse_open_document(
+        self, document: pymupdf.Document, document_path: str
+    ) -> Tuple[Document, OCRUsageStatsConfig]:
+        page_count = document.page_count
+        self._logger.debug(
+            "ドキュメントを開きました: %s, ページ数: %d", document_path, page_count
+        )
+
+        # 複数ページのドキュメントはページごとに並列で抽出する
+        if page_count > 1:
+            return self._get_document_parallel(document_path, page_count)
 
         # データを格納する変数を定義
         pages: List[Page] = []
         sections: List[Section] = []
-        paragraphs: List[Paragraph] = []
         paragraph_id: int = 0
-        figures: List[Figure] = []
         figure_id: int = 0
-        tables: List[Table] = []
         table_id: int = 0
         page_number: int = 1
 
         # ページごとに処理を行う
         for page in document:
-            text_page = page.get_textpage()
+            text_page = page.get_textpage(flags=_TEXTPAGE_FLAGS)
+            # page.rectはアクセスごとにRectを生成するのでページ単位で一度だけ取る
+            page_rect = page.rect
+            width = page_rect.width
+            height = page_rect.height
 
             # 段落と図のリストを取得
             paragraphs, figures = self._get_paragraphs_figures_from_text_page(
                 text_page,
-                page.rect.width,
-                page.rect.height,
+                width,
+                height,
                 page_number,
                 paragraph_id,
                 figure_id,
             )
-            paragraphs.extend(paragraphs)
-            figures.extend(figures)
+            paragraph_id_start = paragraph_id
+            figure_id_start = figure_id
             paragraph_id += len(paragraphs)
             figure_id += len(figures)
 
@@ -70,13 +188,13 @@ class PyMuPDFOCRRepository(IOCRRepository):
                 page_number,
                 table_id,
             )
-            tables.extend(tables)
+            table_id_start = table_id
             table_id += len(tables)
 
             # ページエンティティを作成
             page_entity = Page(
-                width=page.rect.width,
-                height=page.rect.height,
+                width=width,
+                height=height,
                 page_number=page_number,
                 paragraphs=paragraphs,
                 figures=figures,
@@ -86,14 +204,15 @@ class PyMuPDFOCRRepository(IOCRRepository):
             )
 
             # セクションエンティティを作成
+            # IDはページ内で連番なので、要素を走査せずrangeから構築する
             section_entity = Section(
                 section_id=page_number,
                 paragraphs=paragraphs,
-                paragraph_ids=[p.paragraph_id for p in paragraphs],
+                paragraph_ids=list(range(paragraph_id_start, paragraph_id)),
                 tables=tables,
-                table_ids=[t.table_id for t in tables],
+                table_ids=list(range(table_id_start, table_id)),
                 figures=figures,
-                figure_ids=[f.figure_id for f in figures],
+                figure_ids=list(range(figure_id_start, figure_id)),
             )
 
             sections.append(section_entity)
@@ -108,6 +227,87 @@ class PyMuPDFOCRRepository(IOCRRepository):
 
         return document_entity, OCRUsageStatsConfig(page_count=len(pages))
 
+    def _get_document_parallel(
+        self, document_path: str, page_count: int
+    ) -> Tuple[Document, OCRUsageStatsConfig]:
+        """ページごとの要素抽出をプロセスプールで並列実行する
+
+        Args:
+            document_path (str): ドキュメントのパス
+            page_count (int): ページ数
+
+        Returns:
+            Tuple[Document, OCRUsageStatsConfig]: ドキュメントと使用統計情報
+        """
+        # max_tasks_per_childは指定しない: 指定するとfork開始方式が使えず
+        # 暗黙にspawnへ切り替わり、__main__ガードのない呼び出し元を壊す。
+        # 1タスク=1ページでプールはドキュメントごとに破棄されるため、
+        # MuPDF内部キャッシュの成長はもともとドキュメント単位で頭打ちになる
+        with ProcessPoolExecutor(
+            max_workers=min(default_worker_count(), page_count),
+            initializer=_init_worker,
+            initargs=(document_path,),
+        ) as executor:
+            results = list(
+                executor.map(_extract_page_elements, range(1, page_count + 1))
+            )
+
+        # ページ順にIDのオフセットを振り直してエンティティを組み立てる
+        # ページ数は確定しているのでリストは先に確保して添字で書き込む
+        pages: List[Page] = [None] * page_count  # type: ignore[list-item]
+        sections: List[Section] = [None] * page_count  # type: ignore[list-item]
+        paragraph_id: int = 0
+        figure_id: int = 0
+        table_id: int = 0
+        for (
+            page_number,
+            width,
+            height,
+            page_paragraphs,
+            page_figures,
+            page_tables,
+        ) in results:
+            for paragraph in page_paragraphs:
+                paragraph.paragraph_id += paragraph_id
+            for figure in page_figures:
+                figure.figure_id += figure_id
+            for table in page_tables:
+                table.table_id += table_id
+            paragraph_id_start = paragraph_id
+            figure_id_start = figure_id
+            table_id_start = table_id
+            paragraph_id += len(page_paragraphs)
+            figure_id += len(page_figures)
+            table_id += len(page_tables)
+
+            pages[page_number - 1] = Page(
+                width=width,
+                height=height,
+                page_number=page_number,
+                paragraphs=page_paragraphs,
+                figures=page_figures,
+                tables=page_tables,
+                formulas=[],
+                display_formulas=[],
+            )
+            # IDはページ内で連番なので、要素を走査せずrangeから構築する
+            sections[page_number - 1] = Section(
+                section_id=page_number,
+                paragraphs=page_paragraphs,
+                paragraph_ids=list(range(paragraph_id_start, paragraph_id)),
+                tables=page_tables,
+                table_ids=list(range(table_id_start, table_id)),
+                figures=page_figures,
+                figure_ids=list(range(figure_id_start, figure_id)),
+            )
+
+        document_entity = Document(
+            pages=pages,
+            sections=sections,
+        )
+
+        return document_entity, OCRUsageStatsConfig(page_count=len(pages))
+
     def get_pages(self, document_path: str) -> Tuple[List[Page], OCRUsageStatsConfig]:
         """ページを取得する
 
@@ -151,18 +351,26 @@ class PyMuPDFOCRRepository(IOCRRepository):
             List[Table]: テーブルのリスト
         """
         tables: List[Table] = []
+
+        # strategy="lines"は罫線ベースの検出なので、線画のないページは
+        # TableFinderのエッジ抽出・クラスタリングを走らせるまでもない
+        if not page.get_cdrawings():
+            return tables
+
         table_finder = page.find_tables(strategy="lines")
 
-        for table in table_finder.tables:
-            bbox = table.bbox
-            table_entity = Table(
-                table_id=current_table_id,
-                bbox=bbox,
-                page_number=page_number,
-                element_paragraph_ids=[],
-                image_data=None,
-            )
-            tables.append(table_entity)
+        # TableFinderのスキーマは安定しているので属性チェックは一度だけ行う
+        found_tables = getattr(table_finder, "tables", None)
+        if not found_tables:
+            return tables
+
+        tables_append = tables.append
+        for table in found_tables:
+            try:
+                bbox = table.bbox
+            except AttributeError:
+                continue
+            tables_append(Table(current_table_id, bbox, page_number))
             current_table_id += 1
 
         return tables
@@ -194,43 +402,36 @@ class PyMuPDFOCRRepository(IOCRRepository):
         # 1. ページ内のテキストブロック・画像ブロックを取得して処理する
         blocks = text_page.extractBLOCKS()
 
-        for block in blocks:
-            x0, y0, x1, y1, block_content, block_no, block_type = block
+        # ページの向きはブロック間で共通なので、バウンディングボックスの
+        # 回転変換はページ単位で一括計算する
+        if width < height:
+            bboxes = [(b[0], b[1], b[2], b[3]) for b in blocks]
+        else:
+            bboxes = [(width - b[3], b[0], width - b[1], b[2]) for b in blocks]
+
+        # ブロック数の多いページでのappendの属性参照コストを抑える
+        paragraphs_append = paragraphs.append
+        figures_append = figures.append
+
+        for block, bbox in zip(blocks, bboxes):
+            block_content = block[4]
+            block_type = block[6]
 
             # 画像ブロックの場合
             if block_type == 1:
-                # 図のエンティティを作成
-                figure_entity = Figure(
-                    figure_id=current_figure_id,
-                    # ページの幅と高さを比較して、バウンディングボックスを作成
-                    bbox=(
-                        (x0, y0, x1, y1)
-                        if width < height
-                        else (width - y1, x0, width - y0, x1)
-                    ),
-                    page_number=page_number,
-                    image_data=None,
-                    element_paragraph_ids=[],
-                )
-                figures.append(figure_entity)
+                # 図のエンティティを作成（ホットループなのでフィールド順の
+                # 位置引数で渡してキーワード照合のコストを省く）
+                figures_append(Figure(current_figure_id, bbox, page_number))
                 current_figure_id += 1
 
             # テキストブロックの場合
             elif block_type == 0:
                 # 段落のエンティティを作成
-                paragraph_entity = Paragraph(
-                    paragraph_id=current_paragraph_id,
-                    # ページの幅と高さを比較して、バウンディングボックスを作成
-                    bbox=(
-                        (x0, y0, x1, y1)
-                        if width < height
-                        else (width - y1, x0, width - y0, x1)
-                    ),
-                    page_number=page_number,
-                    role=None,
-                    content=block_content,
+                paragraphs_append(
+                    Paragraph(
+                        current_paragraph_id, None, block_content, bbox, page_number
+                    )
                 )
-                paragraphs.append(paragraph_entity)
                 current_paragraph_id += 1
 
         return paragraphs, figures
@@ -1 +1,10 @@
-from .config import settings
\ No newline at end of file
+from typing import Any
+
+from .config import Settings, get_settings
+
+
+def __getattr__(name: str) -> Any:
+    # `from ocr_module.config import settings` の互換を保ちつつ遅延構築する
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
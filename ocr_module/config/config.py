@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import Any, Callable, Set
 
 from pydantic import (
@@ -30,5 +31,14 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str
 
 
-# Load the settings
-settings = Settings()
+# Load the settings lazily: importing this module no longer reads and
+# validates the env file; the parsed Settings is built once on first access.
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
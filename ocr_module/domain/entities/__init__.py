@@ -2,6 +2,11 @@ import json
 from dataclasses import dataclass, field
 from typing import List, Any
 
+try:
+    import orjson
+except ImportError:  # orjsonが無い環境では標準のjsonにフォールバックする
+    orjson = None
+
 from .page_models import (
     Formula,
     DisplayFormula,
@@ -31,7 +36,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     pages: List[Page]
     sections: List[Section]
@@ -45,10 +50,18 @@ class Document:
         )
 
     def to_json(self) -> str:
+        if orjson is not None:
+            return orjson.dumps(self.to_dict()).decode("utf-8")
         return json.dumps(self.to_dict())
 
+    def to_json_bytes(self) -> bytes:
+        """strへのデコードを挟まずにJSONバイト列を返す"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode("utf-8")
+
 
-@dataclass
+@dataclass(slots=True)
 class TranslatedDocument:
     pages: List[PageWithTranslation]
     sections: List[SectionWithTranslation]
@@ -62,4 +75,12 @@ class TranslatedDocument:
         )
 
     def to_json(self) -> str:
+        if orjson is not None:
+            return orjson.dumps(self.to_dict()).decode("utf-8")
         return json.dumps(self.to_dict())
+
+    def to_json_bytes(self) -> bytes:
+        """strへのデコードを挟まずにJSONバイト列を返す"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode("utf-8")
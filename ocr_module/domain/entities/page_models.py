@@ -1,8 +1,79 @@
-from dataclasses import asdict, dataclass
+import json
+import sys
+from dataclasses import dataclass, field
 from typing import List, Literal, Optional, Tuple
 
-
-@dataclass
+try:
+    import orjson
+except ImportError:  # orjsonが無い環境では標準のjsonにフォールバックする
+    orjson = None
+
+
+# Page.to_dict / PageWithTranslation.to_dictの内包表記から直接呼ぶための
+# モジュールレベル関数。要素ごとのバウンドメソッド生成を避ける。
+def _formula_dict(formula: "Formula") -> dict:
+    return {
+        "formula_id": formula.formula_id,
+        "latex_value": formula.latex_value,
+        "bbox": formula.bbox,
+        "type": formula.type,
+        "page_number": formula.page_number,
+    }
+
+
+def _display_formula_dict(display_formula: "DisplayFormula") -> dict:
+    # image_dataはdict化しない
+    return {
+        "formula_id": display_formula.formula_id,
+        "latex_value": display_formula.latex_value,
+        "bbox": display_formula.bbox,
+        "type": display_formula.type,
+        "page_number": display_formula.page_number,
+    }
+
+
+def _paragraph_dict(paragraph: "Paragraph") -> dict:
+    return {
+        "paragraph_id": paragraph.paragraph_id,
+        "role": paragraph.role,
+        "content": paragraph.content,
+        "bbox": paragraph.bbox,
+        "page_number": paragraph.page_number,
+    }
+
+
+def _paragraph_with_translation_dict(paragraph: "ParagraphWithTranslation") -> dict:
+    return {
+        "paragraph_id": paragraph.paragraph_id,
+        "role": paragraph.role,
+        "content": paragraph.content,
+        "bbox": paragraph.bbox,
+        "page_number": paragraph.page_number,
+        "translation": paragraph.translation,
+    }
+
+
+def _figure_dict(figure: "Figure") -> dict:
+    # image_dataはdict化しない
+    return {
+        "figure_id": figure.figure_id,
+        "bbox": figure.bbox,
+        "page_number": figure.page_number,
+        "element_paragraph_ids": figure.element_paragraph_ids,
+    }
+
+
+def _table_dict(table: "Table") -> dict:
+    # image_dataはdict化しない
+    return {
+        "table_id": table.table_id,
+        "bbox": table.bbox,
+        "page_number": table.page_number,
+        "element_paragraph_ids": table.element_paragraph_ids,
+    }
+
+
+@dataclass(slots=True)
 class Formula:
     """
     Formula entity
@@ -25,15 +96,33 @@ class Formula:
     type: Literal["display", "inline"]
     page_number: int
 
+
+    # プロセスプール転送・deepcopy時のpickleをフィールド順のタプルに固定する。
+    # デフォルトのdict状態よりキー分だけ小さく、復元も速い。
+    def __getstate__(self) -> tuple:
+        return (self.formula_id, self.latex_value, self.bbox, self.type, self.page_number)
+
+    def __setstate__(self, state: tuple) -> None:
+        (self.formula_id, self.latex_value, self.bbox, self.type, self.page_number) = state
+
     def to_dict(self) -> dict:
-        return asdict(self)
+        # asdictはフィールドを再帰的にdeepcopyするため、アトミックな
+        # フィールドしか持たないエンティティではdictリテラルで十分
+        return _formula_dict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Formula":
-        return cls(**data)
+        return cls(
+            formula_id=data["formula_id"],
+            latex_value=data["latex_value"],
+            bbox=tuple(data["bbox"]),
+            # typeは"display"/"inline"の2値なのでinternして1オブジェクトを共有する
+            type=sys.intern(data["type"]),
+            page_number=data["page_number"],
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayFormula:
     """
     Display formula entity
@@ -59,25 +148,31 @@ class DisplayFormula:
     page_number: int
     image_data: Optional[bytes]
 
+
+    # プロセスプール転送・deepcopy時のpickleをフィールド順のタプルに固定する。
+    # デフォルトのdict状態よりキー分だけ小さく、復元も速い。
+    def __getstate__(self) -> tuple:
+        return (self.formula_id, self.latex_value, self.bbox, self.type, self.page_number, self.image_data)
+
+    def __setstate__(self, state: tuple) -> None:
+        (self.formula_id, self.latex_value, self.bbox, self.type, self.page_number, self.image_data) = state
+
     def to_dict(self) -> dict:
-        d = asdict(self)
-        d.pop("image_data")
-        return d
+        return _display_formula_dict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> "DisplayFormula":
         return cls(
             formula_id=data["formula_id"],
             latex_value=data["latex_value"],
-            bbox=data["bbox"],
-            type=data["type"],
+            bbox=tuple(data["bbox"]),
+            type=sys.intern(data["type"]),
             page_number=data["page_number"],
             image_data=None,  # dictからの復元時はimage_dataはNoneとする
         )
 
 
-@dataclass
-@dataclass
+@dataclass(slots=True)
 class Paragraph:
     """
     Paragraph entity
@@ -100,9 +195,17 @@ class Paragraph:
     bbox: Tuple[float, float, float, float]
     page_number: int
 
+
+    # プロセスプール転送・deepcopy時のpickleをフィールド順のタプルに固定する。
+    # デフォルトのdict状態よりキー分だけ小さく、復元も速い。
+    def __getstate__(self) -> tuple:
+        return (self.paragraph_id, self.role, self.content, self.bbox, self.page_number)
+
+    def __setstate__(self, state: tuple) -> None:
+        (self.paragraph_id, self.role, self.content, self.bbox, self.page_number) = state
+
     def to_dict(self) -> dict:
-        d = asdict(self)
-        return d
+        return _paragraph_dict(self)
 
     def to_paragraph_with_translation(self) -> "ParagraphWithTranslation":
         return ParagraphWithTranslation(
@@ -117,12 +220,27 @@ class Paragraph:
     def content_length(self) -> int:
         return len(self.content or "")
 
+    # 翻訳の重複排除キャッシュはcontentをキーにするため、ハッシュは
+    # contentのみで計算する（__eq__が等しければcontentも等しいので整合する）
+    def __hash__(self) -> int:
+        return hash(self.content)
+
     @classmethod
     def from_dict(cls, data: dict) -> "Paragraph":
-        return cls(**{k: v for k, v in data.items() if k != "image_data"})
+        # 全キーを走査してimage_dataを除外するdict内包は、段落数に比例して
+        # 無駄な割り当てを生むため、必要なフィールドだけを直接取り出す
+        role = data["role"]
+        return cls(
+            paragraph_id=data["paragraph_id"],
+            # roleは少数の固定語彙なのでinternして1オブジェクトを共有する
+            role=sys.intern(role) if role is not None else None,
+            content=data["content"],
+            bbox=tuple(data["bbox"]),
+            page_number=data["page_number"],
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class ParagraphWithTranslation:
     """ParagraphWithTranslation entity.
 
@@ -157,16 +275,32 @@ class ParagraphWithTranslation:
     #     paragraph: Paragraph
     #     translation_content: str
     # ```
+
+    # プロセスプール転送・deepcopy時のpickleをフィールド順のタプルに固定する。
+    # デフォルトのdict状態よりキー分だけ小さく、復元も速い。
+    def __getstate__(self) -> tuple:
+        return (self.paragraph_id, self.role, self.content, self.bbox, self.page_number, self.translation)
+
+    def __setstate__(self, state: tuple) -> None:
+        (self.paragraph_id, self.role, self.content, self.bbox, self.page_number, self.translation) = state
+
     def to_dict(self) -> dict:
-        d = asdict(self)
-        return d
+        return _paragraph_with_translation_dict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> "ParagraphWithTranslation":
-        return cls(**data)
+        role = data["role"]
+        return cls(
+            paragraph_id=data["paragraph_id"],
+            role=sys.intern(role) if role is not None else None,
+            content=data["content"],
+            bbox=tuple(data["bbox"]),
+            page_number=data["page_number"],
+            translation=data["translation"],
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Figure:
     """
     Figure entity
@@ -184,27 +318,34 @@ class Figure:
     figure_id: int
     bbox: Tuple[float, float, float, float]
     page_number: int
-    image_data: Optional[bytes]
-    element_paragraph_ids: List[int]
+    image_data: Optional[bytes] = None
+    element_paragraph_ids: List[int] = field(default_factory=list)
+
+
+    # プロセスプール転送・deepcopy時のpickleをフィールド順のタプルに固定する。
+    # デフォルトのdict状態よりキー分だけ小さく、復元も速い。
+    def __getstate__(self) -> tuple:
+        return (self.figure_id, self.bbox, self.page_number, self.image_data, self.element_paragraph_ids)
+
+    def __setstate__(self, state: tuple) -> None:
+        (self.figure_id, self.bbox, self.page_number, self.image_data, self.element_paragraph_ids) = state
 
     def to_dict(self) -> dict:
-        d = asdict(self)
-        d.pop("image_data")
-        return d
+        return _figure_dict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Figure":
         # image_dataがない場合はNoneを設定
         return cls(
             figure_id=data["figure_id"],
-            bbox=data["bbox"],
+            bbox=tuple(data["bbox"]),
             page_number=data["page_number"],
             image_data=None,  # dictからの復元時はimage_dataはNoneとする
             element_paragraph_ids=data["element_paragraph_ids"],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """
     Table entity
@@ -222,26 +363,33 @@ class Table:
     table_id: int
     bbox: Tuple[float, float, float, float]
     page_number: int
-    image_data: Optional[bytes]
-    element_paragraph_ids: List[int]
+    image_data: Optional[bytes] = None
+    element_paragraph_ids: List[int] = field(default_factory=list)
+
+
+    # プロセスプール転送・deepcopy時のpickleをフィールド順のタプルに固定する。
+    # デフォルトのdict状態よりキー分だけ小さく、復元も速い。
+    def __getstate__(self) -> tuple:
+        return (self.table_id, self.bbox, self.page_number, self.image_data, self.element_paragraph_ids)
+
+    def __setstate__(self, state: tuple) -> None:
+        (self.table_id, self.bbox, self.page_number, self.image_data, self.element_paragraph_ids) = state
 
     def to_dict(self) -> dict:
-        d = asdict(self)
-        d.pop("image_data")
-        return d
+        return _table_dict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Table":
         return cls(
             table_id=data["table_id"],
-            bbox=data["bbox"],
+            bbox=tuple(data["bbox"]),
             page_number=data["page_number"],
             image_data=None,  # dictからの復元時はimage_dataはNoneとする
             element_paragraph_ids=data["element_paragraph_ids"],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Page:
     """
     Page entity
@@ -278,15 +426,26 @@ class Page:
             page_number=self.page_number,
             width=self.width,
             height=self.height,
-            formulas=[formula.to_dict() for formula in self.formulas],
+            formulas=[_formula_dict(formula) for formula in self.formulas],
             display_formulas=[
-                display_formula.to_dict() for display_formula in self.display_formulas
+                _display_formula_dict(display_formula)
+                for display_formula in self.display_formulas
             ],
-            paragraphs=[paragraph.to_dict() for paragraph in self.paragraphs],
-            figures=[figure.to_dict() for figure in self.figures],
-            tables=[table.to_dict() for table in self.tables],
+            paragraphs=[_paragraph_dict(paragraph) for paragraph in self.paragraphs],
+            figures=[_figure_dict(figure) for figure in self.figures],
+            tables=[_table_dict(table) for table in self.tables],
         )
 
+    def to_json_bytes(self) -> bytes:
+        """ページをJSONバイト列に直接シリアライズする
+
+        json.dumps(page.to_dict())のstr経由を省き、ファイルやレスポンスに
+        そのまま書けるbytesを返す。
+        """
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode("utf-8")
+
     def to_page_with_translation(self) -> "PageWithTranslation":
         return PageWithTranslation(
             page_number=self.page_number,
@@ -304,21 +463,27 @@ class Page:
 
     @classmethod
     def from_dict(cls, data: dict) -> "Page":
+        # 要素ごとのグローバル名+属性の解決を避けるためローカルに束縛する
+        formula_from_dict = Formula.from_dict
+        display_formula_from_dict = DisplayFormula.from_dict
+        paragraph_from_dict = Paragraph.from_dict
+        figure_from_dict = Figure.from_dict
+        table_from_dict = Table.from_dict
         return cls(
             page_number=data["page_number"],
             width=data["width"],
             height=data["height"],
-            formulas=[Formula.from_dict(f) for f in data["formulas"]],
+            formulas=[formula_from_dict(f) for f in data["formulas"]],
             display_formulas=[
-                DisplayFormula.from_dict(df) for df in data["display_formulas"]
+                display_formula_from_dict(df) for df in data["display_formulas"]
             ],
-            paragraphs=[Paragraph.from_dict(p) for p in data["paragraphs"]],
-            figures=[Figure.from_dict(f) for f in data["figures"]],
-            tables=[Table.from_dict(t) for t in data["tables"]],
+            paragraphs=[paragraph_from_dict(p) for p in data["paragraphs"]],
+            figures=[figure_from_dict(f) for f in data["figures"]],
+            tables=[table_from_dict(t) for t in data["tables"]],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PageWithTranslation:
     """
     Page with translation entity
@@ -355,28 +520,41 @@ class PageWithTranslation:
             page_number=self.page_number,
             width=self.width,
             height=self.height,
-            paragraphs=[paragraph.to_dict() for paragraph in self.paragraphs],
-            formulas=[formula.to_dict() for formula in self.formulas],
+            paragraphs=[
+                _paragraph_with_translation_dict(paragraph)
+                for paragraph in self.paragraphs
+            ],
+            formulas=[_formula_dict(formula) for formula in self.formulas],
             display_formulas=[
-                display_formula.to_dict() for display_formula in self.display_formulas
+                _display_formula_dict(display_formula)
+                for display_formula in self.display_formulas
             ],
-            figures=[figure.to_dict() for figure in self.figures],
-            tables=[table.to_dict() for table in self.tables],
+            figures=[_figure_dict(figure) for figure in self.figures],
+            tables=[_table_dict(table) for table in self.tables],
         )
 
+    def to_json_bytes(self) -> bytes:
+        """ページをJSONバイト列に直接シリアライズする"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode("utf-8")
+
     @classmethod
     def from_dict(cls, data: dict) -> "PageWithTranslation":
+        paragraph_from_dict = ParagraphWithTranslation.from_dict
+        formula_from_dict = Formula.from_dict
+        display_formula_from_dict = DisplayFormula.from_dict
+        figure_from_dict = Figure.from_dict
+        table_from_dict = Table.from_dict
         return cls(
             page_number=data["page_number"],
             width=data["width"],
             height=data["height"],
-            paragraphs=[
-                ParagraphWithTranslation.from_dict(p) for p in data["paragraphs"]
-            ],
-            formulas=[Formula.from_dict(f) for f in data["formulas"]],
+            paragraphs=[paragraph_from_dict(p) for p in data["paragraphs"]],
+            formulas=[formula_from_dict(f) for f in data["formulas"]],
             display_formulas=[
-                DisplayFormula.from_dict(df) for df in data["display_formulas"]
+                display_formula_from_dict(df) for df in data["display_formulas"]
             ],
-            figures=[Figure.from_dict(f) for f in data["figures"]],
-            tables=[Table.from_dict(t) for t in data["tables"]],
+            figures=[figure_from_dict(f) for f in data["figures"]],
+            tables=[table_from_dict(t) for t in data["tables"]],
         )
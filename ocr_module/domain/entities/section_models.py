@@ -1,10 +1,10 @@
 from dataclasses import dataclass
-from typing import List, Literal, Optional
+from typing import List
 
 from .page_models import Figure, Paragraph, ParagraphWithTranslation, Table
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """
     Section entity
@@ -43,18 +43,21 @@ class Section:
 
     @classmethod
     def from_dict(cls, data: dict) -> "Section":
+        paragraph_from_dict = Paragraph.from_dict
+        table_from_dict = Table.from_dict
+        figure_from_dict = Figure.from_dict
         return cls(
             section_id=data["section_id"],
-            paragraphs=[Paragraph.from_dict(p) for p in data["paragraphs"]],
+            paragraphs=[paragraph_from_dict(p) for p in data["paragraphs"]],
             paragraph_ids=data["paragraph_ids"],
-            tables=[Table.from_dict(t) for t in data["tables"]],
+            tables=[table_from_dict(t) for t in data["tables"]],
             table_ids=data["table_ids"],
-            figures=[Figure.from_dict(f) for f in data["figures"]],
+            figures=[figure_from_dict(f) for f in data["figures"]],
             figure_ids=data["figure_ids"],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionWithTranslation:
     """
     Section with translation entity
@@ -88,16 +91,44 @@ class SectionWithTranslation:
             figure_ids=self.figure_ids,
         )
 
+    @classmethod
+    def from_section(
+        cls,
+        section: Section,
+        paragraphs: List[ParagraphWithTranslation],
+    ) -> "SectionWithTranslation":
+        """Sectionのメタデータを引き継ぎ、段落だけ翻訳済みのものに差し替える
+
+        tablesやfigures等のリストはコピーせず参照のまま共有する。
+
+        Args:
+            section (Section): 元のSection
+            paragraphs (List[ParagraphWithTranslation]): 翻訳済みの段落
+
+        Returns:
+            SectionWithTranslation: 生成したエンティティ
+        """
+        return cls(
+            section_id=section.section_id,
+            paragraphs=paragraphs,
+            paragraph_ids=section.paragraph_ids,
+            tables=section.tables,
+            table_ids=section.table_ids,
+            figures=section.figures,
+            figure_ids=section.figure_ids,
+        )
+
     @classmethod
     def from_dict(cls, data: dict) -> "SectionWithTranslation":
+        paragraph_from_dict = ParagraphWithTranslation.from_dict
+        table_from_dict = Table.from_dict
+        figure_from_dict = Figure.from_dict
         return cls(
             section_id=data["section_id"],
-            paragraphs=[
-                ParagraphWithTranslation.from_dict(p) for p in data["paragraphs"]
-            ],
+            paragraphs=[paragraph_from_dict(p) for p in data["paragraphs"]],
             paragraph_ids=data["paragraph_ids"],
-            tables=[Table.from_dict(t) for t in data["tables"]],
+            tables=[table_from_dict(t) for t in data["tables"]],
             table_ids=data["table_ids"],
-            figures=[Figure.from_dict(f) for f in data["figures"]],
+            figures=[figure_from_dict(f) for f in data["figures"]],
             figure_ids=data["figure_ids"],
         )
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class TranslationUsageStatsConfig:
     """TranslationUsageStatsConfig entity
     Args:
@@ -18,6 +18,7 @@ class TranslationUsageStatsConfig:
         billed_character_count (int): Billed character count used for translation
         input_token_count (int): Input token count used for translation
         output_token_count (int): Output token count used for translation
+        failed_sections_count (int): Number of sections that fell back to source text
     """
     model_name: str = ""
     version: str = ""
@@ -25,6 +26,24 @@ class TranslationUsageStatsConfig:
     billed_characters_count: int = 0
     input_tokens_count: int = 0
     output_tokens_count: int = 0
+    failed_sections_count: int = 0
+
+    def add(self, other: "TranslationUsageStatsConfig") -> None:
+        """別の統計をこの統計に合算する
+
+        数値カウンタは加算し、モデル情報（model_name等）は空でなければ
+        otherの値で上書きする。
+
+        Args:
+            other (TranslationUsageStatsConfig): 合算する統計
+        """
+        self.model_name = other.model_name or self.model_name
+        self.version = other.version or self.version
+        self.api_endpoint = other.api_endpoint or self.api_endpoint
+        self.billed_characters_count += other.billed_characters_count
+        self.input_tokens_count += other.input_tokens_count
+        self.output_tokens_count += other.output_tokens_count
+        self.failed_sections_count += other.failed_sections_count
 
     def to_dict(self) -> dict:
         return dict(
@@ -34,6 +53,7 @@ class TranslationUsageStatsConfig:
             billed_characters_count=self.billed_characters_count,
             input_token_count=self.input_tokens_count,
             output_token_count=self.output_tokens_count,
+            failed_sections_count=self.failed_sections_count,
         )
 
     @classmethod
@@ -41,7 +61,7 @@ class TranslationUsageStatsConfig:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRUsageStatsConfig:
     """OCRUsageStatsConfig entity
     Args:
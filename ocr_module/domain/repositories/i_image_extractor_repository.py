@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 
 class IImageExtractorRepository(ABC):
@@ -28,3 +28,26 @@ class IImageExtractorRepository(ABC):
                            画像が見つからない場合はNone
         """
         raise NotImplementedError
+
+    def extract_images(
+        self,
+        pdf_path: str,
+        requests: List[Tuple[int, Tuple[float, float, float, float]]],
+    ) -> List[Optional[bytes]]:
+        """PDFから複数領域の画像をまとめて抽出する
+
+        実装側はページのデコードを領域間で共有するなどの最適化を行ってよい。
+        デフォルト実装はextract_imageを順に呼び出す。
+
+        Args:
+            pdf_path (str): PDFファイルのパス
+            requests (List[Tuple[int, Tuple[float, float, float, float]]]):
+                (ページ番号, 画像の位置情報)のリスト
+
+        Returns:
+            List[Optional[bytes]]: requestsと同順の画像バイナリデータのリスト
+        """
+        return [
+            self.extract_image(pdf_path, page_number, inch_bbox)
+            for page_number, inch_bbox in requests
+        ]
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from ocr_module.domain.entities import (
     Paragraph,
@@ -68,6 +69,34 @@ class ITranslateSectionRepository(ABC):
         """
         ...
 
+    async def translate_paragraphs_with_formula_id_async(
+        self,
+        paragraphs: List[Paragraph],
+        source_language: str | None,
+        target_language: str,
+    ) -> Tuple[List[ParagraphWithTranslation], TranslationUsageStatsConfig]:
+        """
+        パラグラフを非同期で翻訳する（数式ID付き）
+
+        デフォルト実装は同期のtranslate_paragraphs_with_formula_idを
+        ワーカースレッドへ逃がす。ネイティブの非同期クライアントを持つ
+        実装は、スレッドを経由しないようこのメソッドをオーバーライドできる。
+
+        Args:
+            paragraphs (List[Paragraph]): パラグラフ
+            source_language (str | None): ソース言語(Noneの場合は自動翻訳)
+            target_language (str): ターゲット言語
+
+        Returns:
+            List[ParagraphWithTranslation]: 翻訳されたパラグラフ
+        """
+        return await asyncio.to_thread(
+            self.translate_paragraphs_with_formula_id,
+            paragraphs,
+            source_language,
+            target_language,
+        )
+
     @abstractmethod
     def translate_paragraphs(
         self,
@@ -87,3 +116,53 @@ class ITranslateSectionRepository(ABC):
             List[ParagraphWithTranslation]: 翻訳されたパラグラフ
         """
         ...
+
+    def translate_paragraphs_batch(
+        self,
+        paragraphs: List[Paragraph],
+        source_language: str | None,
+        target_language: str,
+    ) -> Tuple[List[ParagraphWithTranslation], TranslationUsageStatsConfig]:
+        """同一contentのパラグラフを重複排除してから翻訳する
+
+        見出しやキャプションなど同じ文字列が繰り返し現れるドキュメントでは、
+        ユニークなcontentだけをAPIに送り、結果を元のパラグラフに展開することで
+        API呼び出し量を削減できる。翻訳自体は実装のtranslate_paragraphsに委ねる。
+
+        Args:
+            paragraphs (List[Paragraph]): パラグラフ
+            source_language (str | None): ソース言語(Noneの場合は自動翻訳)
+            target_language (str): ターゲット言語
+
+        Returns:
+            List[ParagraphWithTranslation]: 翻訳されたパラグラフ（入力と同順）
+        """
+        # contentごとに最初に現れたパラグラフを代表として翻訳する
+        representative: Dict[str, Paragraph] = {}
+        for paragraph in paragraphs:
+            representative.setdefault(paragraph.content, paragraph)
+
+        translated, usage_stats = self.translate_paragraphs(
+            list(representative.values()), source_language, target_language
+        )
+        translation_by_content = {
+            paragraph.content: translated_paragraph.translation
+            for paragraph, translated_paragraph in zip(
+                representative.values(), translated
+            )
+        }
+
+        return (
+            [
+                ParagraphWithTranslation(
+                    paragraph_id=paragraph.paragraph_id,
+                    role=paragraph.role,
+                    content=paragraph.content,
+                    bbox=paragraph.bbox,
+                    page_number=paragraph.page_number,
+                    translation=translation_by_content[paragraph.content],
+                )
+                for paragraph in paragraphs
+            ],
+            usage_stats,
+        )
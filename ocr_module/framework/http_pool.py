@@ -0,0 +1,20 @@
+from functools import lru_cache
+
+import httpx
+
+
+@lru_cache(maxsize=1)
+def get_shared_http_client() -> httpx.Client:
+    """プロセス内で共有するHTTPクライアントを返す
+
+    OpenAI/AzureOpenAIのSDKはデフォルトでインスタンスごとにhttpx.Clientを
+    持つため、クライアントを作るたびにTLSハンドシェイクと接続プールの
+    コストを払う。共有クライアントを注入することで、並行する翻訳リクエストが
+    1つのkeep-aliveプールを使い回せるようにする。
+
+    Returns:
+        httpx.Client: 共有のHTTPクライアント
+    """
+    return httpx.Client(
+        limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+    )
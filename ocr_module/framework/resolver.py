@@ -6,15 +6,64 @@ from ..adapters.infra.deepl import DeepLTranslateSectionRepository
 from ..adapters.infra.openai import OpenAITranslateSectionRepository
 from ..adapters.infra.pylatex import PyLaTeXGeneratePDFRepository
 from ..adapters.infra.pymupdf import PyMuPDFGeneratePDFRepository, PyMuPDFImageExtractor, PyMuPDFOCRRepository
-from ..domain.entities import Document, PageWithTranslation, TranslatedDocument
+from ..domain.entities import (
+    Document,
+    PageWithTranslation,
+    TranslatedDocument,
+    TranslationUsageStatsConfig,
+)
+from ..domain.repositories import ITranslateSectionRepository
+from .http_pool import get_shared_http_client
 from ..usecase import (
     ChangeFormulaIdUseCase,
     GenerateTranslatedPDFWithFormulaIdUseCase,
     GetTranslatedPageUseCase,
     TranslateSectionFormulaIdUseCase,
 )
+import asyncio
+from functools import cached_property, lru_cache
+from logging import getLogger
+from subprocess import CalledProcessError
 from openai import AzureOpenAI, OpenAI
-from typing import Literal
+from pylatex.errors import CompilerError
+from typing import Iterable, List, Literal
+
+
+# ステートレスなusecaseはプロセス内で1インスタンスを共有する
+_CHANGE_FORMULA_ID_USECASE = ChangeFormulaIdUseCase()
+_GET_TRANSLATED_PAGE_USECASE = GetTranslatedPageUseCase()
+
+
+@lru_cache(maxsize=None)
+def _get_image_extractor() -> PyMuPDFImageExtractor:
+    """プロセス内で共有するPyMuPDFImageExtractorを返す"""
+    return PyMuPDFImageExtractor()
+
+
+@lru_cache(maxsize=None)
+def _get_azure_ocr_repository(
+    endpoint: str, key: str, model_id: str
+) -> AzureOCRRepository:
+    """同一の接続情報に対するAzureOCRRepositoryを共有する
+
+    Azure SDKクライアントの構築（TLS・認証まわりの初期化）は高コストなので、
+    クライアントを複数作っても接続情報ごとに一度だけ構築する。
+
+    Args:
+        endpoint (str): Azure Document Intelligenceのエンドポイント
+        key (str): Azure Document Intelligenceのキー
+        model_id (str): Azure Document IntelligenceのモデルID
+
+    Returns:
+        AzureOCRRepository: 共有のOCRリポジトリ
+    """
+    return AzureOCRRepository(
+        endpoint=endpoint,
+        key=key,
+        model_id=model_id,
+        image_extractor=_get_image_extractor(),
+    )
+
 
 class AzureOcrClient:
 
@@ -26,14 +75,8 @@ class AzureOcrClient:
             key (str): Azure Document Intelligenceのキー
             model_id (str): Azure Document IntelligenceのモデルID, デフォルトは"prebuilt-layout"
         """
-        self._image_extractor = PyMuPDFImageExtractor()
-        self._ocr_repository = AzureOCRRepository(
-            endpoint=endpoint,
-            key=key,
-            model_id=model_id,
-            image_extractor=self._image_extractor,
-        )
-        self._change_formula_id_usecase = ChangeFormulaIdUseCase()
+        self._ocr_repository = _get_azure_ocr_repository(endpoint, key, model_id)
+        self._change_formula_id_usecase = _CHANGE_FORMULA_ID_USECASE
 
     def get_document_from_path(self, document_path: str) -> Document:
         """localのファイルパスのPDFに対するAzureのOCR結果（Document）を取得する
@@ -62,7 +105,7 @@ class PyMuPDFOcrClient:
         """PyMuPDFOcrClientの初期化
         """
         self._ocr_repository = PyMuPDFOCRRepository()
-        self._change_formula_id_usecase = ChangeFormulaIdUseCase()
+        self._change_formula_id_usecase = _CHANGE_FORMULA_ID_USECASE
 
     def get_document_from_path(self, document_path: str) -> Document:
         """localのファイルパスのPDFに対するPyMuPDFのOCR結果（Document）を取得する
@@ -104,12 +147,22 @@ class OCRClient:
             azure_model_id (str, optional): AzureのモデルID. Defaults to "prebuilt-layout".
         """
         self._ocr_engine = ocr_engine
-        self._azure_ocr_client = AzureOcrClient(
-            endpoint=azure_endpoint,
-            key=azure_api_key,
-            model_id=azure_model_id,
+        self._azure_endpoint = azure_endpoint
+        self._azure_api_key = azure_api_key
+        self._azure_model_id = azure_model_id
+
+    # 選択されたエンジンのクライアントだけを初回利用時に構築する
+    @cached_property
+    def _azure_ocr_client(self) -> AzureOcrClient:
+        return AzureOcrClient(
+            endpoint=self._azure_endpoint,
+            key=self._azure_api_key,
+            model_id=self._azure_model_id,
         )
-        self._pymupdf_ocr_client = PyMuPDFOcrClient()
+
+    @cached_property
+    def _pymupdf_ocr_client(self) -> PyMuPDFOcrClient:
+        return PyMuPDFOcrClient()
 
     def get_document_from_path(self, document_path: str) -> Document:
         """localのファイルパスのPDFに対するOCR結果（Document）を取得する
@@ -125,29 +178,24 @@ class OCRClient:
             raise ValueError(f"Invalid OCR engine: {self._ocr_engine}")
 
 
-class OpenAITranslateClient:
-    def __init__(
-        self,
-        api_key: str,
-        model: str,
-        context: str | None = None,
-    ):
-        """OpenAITranslateClientの初期化
+class _TranslateClientBase:
+    """翻訳クライアントの共通実装
 
-        Args:
-            api_key (str): OpenAIのAPIキー
-            model (str): OpenAIのモデル名, e.g. "gpt-4o"
-            context (str | None, optional): OpenAIのコンテキスト. Defaults to None.
-        """
+    translate_documentの流れ（セクション翻訳 -> ページ整形 -> usage_stats
+    付与）は全エンジンで同一なので、ここに1本化する。サブクラスは
+    リポジトリの構築と_annotate_usage_statsの上書きだけを行う。
+    """
+
+    def __init__(self, translate_section_repository: ITranslateSectionRepository):
         self._translate_section_usecase = TranslateSectionFormulaIdUseCase(
-            translate_section_repository=OpenAITranslateSectionRepository(
-                client=OpenAI(api_key=api_key),
-                model=model,
-                context=context,
-            ),
+            translate_section_repository=translate_section_repository,
         )
-        self._get_translated_page_usecase = GetTranslatedPageUseCase()
-        self._model_name = model
+        self._get_translated_page_usecase = _GET_TRANSLATED_PAGE_USECASE
+
+    def _annotate_usage_stats(
+        self, usage_stats: TranslationUsageStatsConfig
+    ) -> None:
+        """エンジン固有の情報（モデル名等）をusage_statsに書き込む"""
 
     async def translate_document(
         self,
@@ -177,7 +225,7 @@ class OpenAITranslateClient:
             pages=document.pages,
             translated_sections=result.sections,
         )
-        result.usage_stats.model_name = self._model_name
+        self._annotate_usage_stats(result.usage_stats)
 
         return TranslatedDocument(
             pages=translated_pages,
@@ -186,7 +234,39 @@ class OpenAITranslateClient:
         )
 
 
-class AzureOpenAITranslateClient:
+class OpenAITranslateClient(_TranslateClientBase):
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        context: str | None = None,
+    ):
+        """OpenAITranslateClientの初期化
+
+        Args:
+            api_key (str): OpenAIのAPIキー
+            model (str): OpenAIのモデル名, e.g. "gpt-4o"
+            context (str | None, optional): OpenAIのコンテキスト. Defaults to None.
+        """
+        super().__init__(
+            OpenAITranslateSectionRepository(
+                client=OpenAI(
+                    api_key=api_key,
+                    http_client=get_shared_http_client(),
+                ),
+                model=model,
+                context=context,
+            )
+        )
+        self._model_name = model
+
+    def _annotate_usage_stats(
+        self, usage_stats: TranslationUsageStatsConfig
+    ) -> None:
+        usage_stats.model_name = self._model_name
+
+
+class AzureOpenAITranslateClient(_TranslateClientBase):
     def __init__(
         self,
         model: str,
@@ -203,64 +283,32 @@ class AzureOpenAITranslateClient:
             api_key (str): Azure OpenAIのAPIキー
             api_version (str): Azure OpenAIのAPIバージョン
         """
-        self._translate_section_usecase = TranslateSectionFormulaIdUseCase(
-            translate_section_repository=AzureOpenAITranslateSectionRepository(
+        super().__init__(
+            AzureOpenAITranslateSectionRepository(
                 client=AzureOpenAI(
                     api_key=api_key,
                     azure_endpoint=endpoint,
                     api_version=api_version,
+                    http_client=get_shared_http_client(),
                 ),
                 model=model,
                 context=context,
-            ),
+            )
         )
-        self._get_translated_page_usecase = GetTranslatedPageUseCase()
         self._model_name = model
         self._api_version = api_version
         self._endpoint = endpoint
 
-    async def translate_document(
-        self,
-        document: Document,
-        source_language: str | None,
-        target_language: str,
-    ) -> TranslatedDocument:
-        """Azure OpenAIを使用してDocumentを翻訳する
-
-        Args:
-            document (Document): OCR結果
-            source_language (str | None): 翻訳元の言語(None means auto translate)
-            target_language (str): 翻訳先の言語
-
-        Returns:
-            TranslatedDocument: 翻訳済みのOCR結果
-        """
-        # セクションごとに翻訳
-        result = await self._translate_section_usecase.execute_async(
-            document.sections,
-            source_language=source_language,
-            target_language=target_language,
-        )
-
-        # セクションごとの翻訳をページごとのデータに整形しなおす
-        translated_pages = self._get_translated_page_usecase.execute(
-            pages=document.pages,
-            translated_sections=result.sections,
-        )
-
+    def _annotate_usage_stats(
+        self, usage_stats: TranslationUsageStatsConfig
+    ) -> None:
         # 翻訳のusage_statsのうち、model,version,endpointを追加
-        result.usage_stats.model_name = self._model_name
-        result.usage_stats.version = self._api_version
-        result.usage_stats.api_endpoint = self._endpoint
+        usage_stats.model_name = self._model_name
+        usage_stats.version = self._api_version
+        usage_stats.api_endpoint = self._endpoint
 
-        return TranslatedDocument(
-            pages=translated_pages,
-            sections=result.sections,
-            translation_usage_stats=result.usage_stats,
-        )
 
-
-class DeepLTranslateClient:
+class DeepLTranslateClient(_TranslateClientBase):
     def __init__(self, api_key: str, glossary_id: str | None = None):
         """DeepLTranslateClientの初期化
 
@@ -268,47 +316,11 @@ class DeepLTranslateClient:
             api_key (str): DeepLのAPIキー
             glossary_id (str | None, optional): DeepLのグロサリーID. Defaults to None.
         """
-        self._translate_section_usecase = TranslateSectionFormulaIdUseCase(
-            translate_section_repository=DeepLTranslateSectionRepository(
+        super().__init__(
+            DeepLTranslateSectionRepository(
                 api_key=api_key,
                 glossary_id=glossary_id,
-            ),
-        )
-        self._get_translated_page_usecase = GetTranslatedPageUseCase()
-
-    async def translate_document(
-        self,
-        document: Document,
-        source_language: str | None,
-        target_language: str,
-    ) -> TranslatedDocument:
-        """DeepLを使用してDocumentを翻訳する
-
-        Args:
-            document (Document): OCR結果
-            source_language (str | None): 翻訳元の言語(None means auto translate)
-            target_language (str): 翻訳先の言語
-
-        Returns:
-            TranslatedDocument: 翻訳済みのOCR結果
-        """
-        # セクションごとに翻訳
-        result = await self._translate_section_usecase.execute_async(
-            document.sections,
-            source_language=source_language,
-            target_language=target_language,
-        )
-
-        # セクションごとの翻訳をページごとのデータに整形しなおす
-        translated_pages = self._get_translated_page_usecase.execute(
-            pages=document.pages,
-            translated_sections=result.sections,
-        )
-
-        return TranslatedDocument(
-            pages=translated_pages,
-            sections=result.sections,
-            translation_usage_stats=result.usage_stats,
+            )
         )
 
 # 翻訳エンジンを指定することで、翻訳エンジンを切り替えることができる便利クラス
@@ -336,18 +348,50 @@ class TranslateClient:
             context (str | None, optional): Azure OpenAIのコンテキスト. Defaults to None.
             glossary_id (str | None, optional): DeepLのグロサリーID. Defaults to None.
         """
-        self._azure_openai_translate_client = AzureOpenAITranslateClient(
-            model=azure_openai_model,
-            endpoint=azure_openai_endpoint,
-            api_key=azure_openai_api_key,
-            api_version=azure_openai_api_version,
-            context=context,
+        self._azure_openai_model = azure_openai_model
+        self._azure_openai_endpoint = azure_openai_endpoint
+        self._azure_openai_api_key = azure_openai_api_key
+        self._azure_openai_api_version = azure_openai_api_version
+        self._deepl_api_key = deepl_api_key
+        self._context = context
+        self._glossary_id = glossary_id
+        if translation_engine not in self._ENGINE_CLIENT_ATTRIBUTES:
+            raise ValueError(f"Invalid translation engine: {translation_engine}")
+        self._translation_engine = translation_engine
+
+    # エンジン名から対応するクライアント属性への対応表
+    # （構築時に検証し、translate_documentの呼び出しごとの分岐を無くす）
+    _ENGINE_CLIENT_ATTRIBUTES = {
+        "azure_openai": "_azure_openai_translate_client",
+        "deepl": "_deepl_translate_client",
+    }
+
+    # 使われないエンジンのSDKクライアント（HTTP接続プール）を作らないよう、
+    # 選択されたエンジンのクライアントだけを初回利用時に構築する
+    @cached_property
+    def _azure_openai_translate_client(self) -> AzureOpenAITranslateClient:
+        return AzureOpenAITranslateClient(
+            model=self._azure_openai_model,
+            endpoint=self._azure_openai_endpoint,
+            api_key=self._azure_openai_api_key,
+            api_version=self._azure_openai_api_version,
+            context=self._context,
+        )
+
+    @cached_property
+    def _deepl_translate_client(self) -> DeepLTranslateClient:
+        return DeepLTranslateClient(
+            api_key=self._deepl_api_key,
+            glossary_id=self._glossary_id,
         )
-        self._deepl_translate_client = DeepLTranslateClient(
-            api_key=deepl_api_key,
-            glossary_id=glossary_id,
+
+    @cached_property
+    def _translate_document_impl(self):
+        # 選択されたエンジンのtranslate_documentを一度だけ解決して束縛する
+        client = getattr(
+            self, self._ENGINE_CLIENT_ATTRIBUTES[self._translation_engine]
         )
-        self._translation_engine = translation_engine
+        return client.translate_document
 
     async def translate_document(
         self,
@@ -355,16 +399,59 @@ class TranslateClient:
         source_language: str | None,
         target_language: str,
     ) -> TranslatedDocument:
-        if self._translation_engine == "azure_openai":
-            return await self._azure_openai_translate_client.translate_document(
-                document, source_language, target_language
+        return await self._translate_document_impl(
+            document, source_language, target_language
+        )
+
+
+async def translate_documents_pipelined(
+    ocr_client: "OCRClient",
+    translate_client: "TranslateClient",
+    document_paths: Iterable[str],
+    source_language: str | None,
+    target_language: str,
+) -> List[TranslatedDocument]:
+    """複数ドキュメントのOCRと翻訳をパイプライン実行する
+
+    OCRはCPU・ローカルI/Oバウンド、翻訳はネットワークバウンドなので、
+    ドキュメントNの翻訳中にドキュメントN+1のOCRをスレッドで先行実行し、
+    両者のレイテンシを重ね合わせる。結果は入力と同じ順序で返す。
+
+    Args:
+        ocr_client (OCRClient): OCRクライアント
+        translate_client (TranslateClient): 翻訳クライアント
+        document_paths (Iterable[str]): ドキュメントパスのリスト
+        source_language (str | None): 翻訳元の言語(None means auto translate)
+        target_language (str): 翻訳先の言語
+
+    Returns:
+        List[TranslatedDocument]: 翻訳済みドキュメントのリスト（入力順）
+    """
+    results: List[TranslatedDocument] = []
+    next_ocr: "asyncio.Task[Document] | None" = None
+    paths = list(document_paths)
+    for index, path in enumerate(paths):
+        if next_ocr is None:
+            next_ocr = asyncio.create_task(
+                asyncio.to_thread(ocr_client.get_document_from_path, path)
+            )
+        document = await next_ocr
+        # 現在のドキュメントを翻訳している間に次のドキュメントのOCRを進める
+        next_ocr = (
+            asyncio.create_task(
+                asyncio.to_thread(
+                    ocr_client.get_document_from_path, paths[index + 1]
+                )
             )
-        elif self._translation_engine == "deepl":
-            return await self._deepl_translate_client.translate_document(
+            if index + 1 < len(paths)
+            else None
+        )
+        results.append(
+            await translate_client.translate_document(
                 document, source_language, target_language
             )
-        else:
-            raise ValueError(f"Invalid translation engine: {self._translation_engine}")
+        )
+    return results
 
 
 class GeneratePDFClient:
@@ -375,14 +462,17 @@ class GeneratePDFClient:
             pdf_generator_repository (PyLaTeXGeneratePDFRepository): PDF生成器
             error_pdf_generator_repository (PyMuPDFGeneratePDFRepository): エラー時のPDF生成器
         """
+        self._logger = getLogger(__name__)
+        # PyMuPDFフォールバックに切り替えた回数（監視用）
+        self.fallback_count = 0
+        self._pdf_generator_repository = PyLaTeXGeneratePDFRepository()
+        self._error_pdf_generator_repository = PyMuPDFGeneratePDFRepository()
         self._generate_translated_pdf_usecase = (
             GenerateTranslatedPDFWithFormulaIdUseCase(
-                pdf_generator_repository=PyLaTeXGeneratePDFRepository(),
-                error_pdf_generator_repository=PyMuPDFGeneratePDFRepository(),
+                pdf_generator_repository=self._pdf_generator_repository,
+                error_pdf_generator_repository=self._error_pdf_generator_repository,
             )
         )
-        self._pdf_generator_repository = PyLaTeXGeneratePDFRepository()
-        self._error_pdf_generator_repository = PyMuPDFGeneratePDFRepository()
 
     def generate_pdf_from_document(
         self,
@@ -408,6 +498,29 @@ class GeneratePDFClient:
 
         return doc_path, page_paths
 
+    async def generate_pdf_from_document_async(
+        self,
+        document: TranslatedDocument,
+        output_doc_path: str,
+    ) -> tuple[str, list[str]]:
+        """翻訳済みのDocumentを非同期でPDFに変換する
+
+        ページごとのLaTeXコンパイルを並列化しつつ、イベントループを
+        塞がないasync版。翻訳パイプラインから直接awaitできる。
+
+        Args:
+            document (TranslatedDocument): 翻訳済みのDocument
+            output_doc_path (str): 出力先のパス
+
+        Returns:
+            tuple[str, list[str]]: 生成したPDFのパスと、生成したPDFのパスのリスト
+        """
+        return await self._generate_translated_pdf_usecase.execute_async(
+            pages_with_translations=document.pages,
+            output_path=output_doc_path,
+            save_page_file=True,
+        )
+
     def generate_pdf_from_page_with_translation(
         self, page_with_translation: PageWithTranslation, output_path: str
     ) -> str:
@@ -424,8 +537,36 @@ class GeneratePDFClient:
             self._pdf_generator_repository.generate_pdf_with_formula_id(
                 page_with_translation, output_path
             )
-        except Exception as e:
+        except (CompilerError, CalledProcessError) as e:
+            # LaTeXとしてコンパイルできないページだけをフォールバックさせる
+            self._logger.warning(
+                "LaTeX compile failed for page %d, falling back to PyMuPDF: %s",
+                page_with_translation.page_number,
+                e,
+            )
+            self.fallback_count += 1
             self._error_pdf_generator_repository.generate_pdf_with_translation(
                 page_with_translation, output_path
             )
+        except OSError as e:
+            # 一時的なファイルシステムエラーはLaTeX経路をもう一度だけ試す
+            self._logger.warning(
+                "Transient OS error for page %d, retrying LaTeX once: %s",
+                page_with_translation.page_number,
+                e,
+            )
+            try:
+                self._pdf_generator_repository.generate_pdf_with_formula_id(
+                    page_with_translation, output_path
+                )
+            except Exception as retry_error:
+                self._logger.warning(
+                    "Retry failed for page %d, falling back to PyMuPDF: %s",
+                    page_with_translation.page_number,
+                    retry_error,
+                )
+                self.fallback_count += 1
+                self._error_pdf_generator_repository.generate_pdf_with_translation(
+                    page_with_translation, output_path
+                )
         return output_path
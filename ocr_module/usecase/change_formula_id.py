@@ -1,64 +1,73 @@
+import itertools
 import logging
-from logging import getLogger, INFO
-from typing import Dict, List
+import re
+from logging import getLogger
+from typing import List
 
-from ocr_module.domain.entities import Page, Paragraph, Section
+from ocr_module.domain.entities import Page, Section
+
+# :formula:の置換は1パスのre.subで行う（replace(..., 1)の繰り返しは
+# 置換のたびに文字列を先頭から走査し直すため、数式の多い段落でO(k·L)になる）
+_FORMULA_RE = re.compile(r":formula:")
 
 
 class ChangeFormulaIdUseCase:
-    """文中の`:formula:`を`<formula_i/>`に変換する"""
+    """文中の`:formula:`を`<formula_i/>`に変換する
+
+    SectionはPageと同じParagraphインスタンスを共有している（各OCRリポジトリが
+    保証する）ため、ページ側のcontentを書き換えればセクション側にも反映される。
+    """
 
     def __init__(self):
+        # ハンドラとレベルはアプリケーション側のlogging設定に委ねる
         self.logger = getLogger(__name__)
-        self.logger.setLevel(INFO)
-        # 既存のハンドラを削除
-        # for handler in self.logger.handlers:
-        #     self.logger.removeHandler(handler)
-        # 新しいハンドラを追加
-        # self.logger.addHandler(logging.StreamHandler())
-        # # ファイルにログを出力
-        # self.logger.addHandler(logging.FileHandler("change_formula_id.log", mode="w"))
-        # self.logger.setLevel(logging.INFO)
 
     def execute(self, pages: List[Page], sections: List[Section]) -> List[Section]:
-        processed_pages: List[Page] = []
-        processed_paragraphs: Dict[int, Paragraph] = {}
-        # 各ページのパラグラフの内容を結合
-        page_text = "\n".join(
-            [paragraph.content for page in pages for paragraph in page.paragraphs]
-        )
-        self.logger.debug(f"Before processed pages: {page_text}")
+        # 数式の無いドキュメントでは以降の走査・置換・ログがすべて無駄なので
+        # 先に打ち切る（strのinはC実装なのでこの判定自体は安価）
+        if not any(
+            ":formula:" in paragraph.content
+            for page in pages
+            for paragraph in page.paragraphs
+        ):
+            return sections
+
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            # 各ページのパラグラフの内容を結合（DEBUG時のみ。全文の連結は
+            # 大きなドキュメントでO(総文字数)の割り当てになる）
+            self.logger.debug(
+                "Before processed pages: %s",
+                "\n".join(
+                    paragraph.content
+                    for page in pages
+                    for paragraph in page.paragraphs
+                ),
+            )
+        # Paragraphインスタンスはページとセクションで共有されているため、
+        # ページ側の書き換えだけでセクションへの反映も完了する
         for page in pages:
-            processed_page = self.change_formula_tag_in_page(page)
-            processed_pages.append(processed_page)
-            for paragraph in processed_page.paragraphs:
-                processed_paragraphs[paragraph.paragraph_id] = paragraph
+            self.change_formula_tag_in_page(page)
 
-        for section in sections:
-            for paragraph in section.paragraphs:
-                if paragraph.paragraph_id in processed_paragraphs:
-                    paragraph.content = processed_paragraphs[
-                        paragraph.paragraph_id
-                    ].content
-                    self.logger.debug(
-                        f"Changed formula tag in paragraph {paragraph.paragraph_id}: {paragraph.content}"
-                    )
-        self.logger.debug(f"Processed sections: {sections}")
+        if debug_enabled:
+            self.logger.debug("Processed sections: %s", sections)
 
         return sections
 
     def change_formula_tag_in_page(self, page: Page) -> Page:
-        current_formula_id = 0
+        formula_id_counter = itertools.count()
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         for paragraph in page.paragraphs:
-            num_formula = paragraph.content.count(":formula:")
-            for i in range(num_formula):
-                formula_tag = f"<formula_{current_formula_id}/>"
-                paragraph.content = paragraph.content.replace(
-                    f":formula:", formula_tag, 1
-                )
+            if ":formula:" not in paragraph.content:
+                continue
+            paragraph.content = _FORMULA_RE.sub(
+                lambda _m: f"<formula_{next(formula_id_counter)}/>",
+                paragraph.content,
+            )
+            if debug_enabled:
                 self.logger.debug(
-                    f"Changed formula tag in paragraph {paragraph.paragraph_id}: {formula_tag}"
+                    "Changed formula tags in paragraph %d: %s",
+                    paragraph.paragraph_id,
+                    paragraph.content,
                 )
-                self.logger.debug(f"Paragraph content: {paragraph.content}")
-                current_formula_id += 1
         return page
@@ -35,32 +35,32 @@ class GetTranslatedPageUseCase:
         sections: List[SectionWithTranslation],
     ) -> Dict[int, ParagraphWithTranslation]:
         # key: paragraph_id , value: ParagraphWithTranslation の dict
-        paragraph_dict: Dict[int, ParagraphWithTranslation] = {}
-        for section in sections:
-            for paragraph in section.paragraphs:
-                paragraph_dict[paragraph.paragraph_id] = paragraph
-        return paragraph_dict
+        return {
+            paragraph.paragraph_id: paragraph
+            for section in sections
+            for paragraph in section.paragraphs
+        }
 
     @staticmethod
     def _convert_page_to_page_with_translation(
         page: Page, paragraph_dict: Dict[int, ParagraphWithTranslation]
     ) -> PageWithTranslation:
-        paragraphs_with_translation: List[ParagraphWithTranslation] = []
-        for paragraph in page.paragraphs:
-            if paragraph.paragraph_id in paragraph_dict:
-                paragraphs_with_translation.append(
-                    paragraph_dict[paragraph.paragraph_id]
-                )
-            else:
-                paragraph_with_translation = ParagraphWithTranslation(
-                    paragraph_id=paragraph.paragraph_id,
-                    role=paragraph.role,
-                    content=paragraph.content,
-                    bbox=paragraph.bbox,
-                    page_number=paragraph.page_number,
-                    translation=paragraph.content,
-                )
-                paragraphs_with_translation.append(paragraph_with_translation)
+        # dictの二重参照（in + []）を避けて1回のgetで引き、
+        # 訳が無いparagraphは原文を訳として位置引数で構築する
+        get_translated = paragraph_dict.get
+        paragraphs_with_translation: List[ParagraphWithTranslation] = [
+            translated
+            if (translated := get_translated(paragraph.paragraph_id)) is not None
+            else ParagraphWithTranslation(
+                paragraph.paragraph_id,
+                paragraph.role,
+                paragraph.content,
+                paragraph.bbox,
+                paragraph.page_number,
+                paragraph.content,
+            )
+            for paragraph in page.paragraphs
+        ]
         return PageWithTranslation(
             page_number=page.page_number,
             width=page.width,
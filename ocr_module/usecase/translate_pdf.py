@@ -1,32 +1,43 @@
-import copy
+import asyncio
+import hashlib
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
-from typing import List
+from operator import itemgetter
+from threading import Lock
+from typing import List, Tuple
 
-from PyPDF2 import PdfMerger
+from pypdf import PdfWriter
 
 from ocr_module.domain.entities import PageWithTranslation
 from ocr_module.domain.repositories import IPDFGeneratorRepository
+from ocr_module.utils import default_worker_count
 
 
 class GenerateTranslatedPDFWithFormulaIdUseCase:
+    # 内容ハッシュをキーにしたページPDFキャッシュの保持件数
+    _PAGE_PDF_CACHE_SIZE = 64
+
     def __init__(
         self,
         pdf_generator_repository: IPDFGeneratorRepository,
         error_pdf_generator_repository: IPDFGeneratorRepository,
-        max_workers: int = 5,
+        max_workers: int | None = None,
     ):
         self.pdf_generator_repository = pdf_generator_repository
         self.error_pdf_generator_repository = error_pdf_generator_repository
-        self.max_workers = max_workers
+        # cgroupでCPU制限された環境ではcpu_countが過大になるため、affinityベースで決める
+        self.max_workers = max_workers if max_workers is not None else default_worker_count()
+        self._page_pdf_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._page_pdf_cache_lock = Lock()
         self.logger = getLogger(__name__)
 
     def _process_page(
         self,
         page_with_translation: PageWithTranslation,
         output_path: str,
-    ) -> str:
+    ) -> Tuple[int, str]:
         """1ページを処理する
 
         Args:
@@ -34,16 +45,38 @@ class GenerateTranslatedPDFWithFormulaIdUseCase:
             output_path (str): documentの出力パス. pageの出力パスは `{output_path.replace(".pdf", "")}_{page_number}.pdf` というパスになる
 
         Returns:
-            str: pageの出力パス (.pdfを含む)
+            Tuple[int, str]: ページ番号とpageの出力パス (.pdfを含む)
         """
         doc_prefix = output_path.replace(".pdf", "")
         page_output_path = f"{doc_prefix}_{page_with_translation.page_number}.pdf"
+
+        # 同一内容のページ（リトライや再実行時）はlatexmkを再実行せず、
+        # 前回のコンパイル結果をそのまま書き出す
+        cache_key = hashlib.sha256(page_with_translation.to_json_bytes()).hexdigest()
+        with self._page_pdf_cache_lock:
+            cached_pdf = self._page_pdf_cache.get(cache_key)
+            if cached_pdf is not None:
+                self._page_pdf_cache.move_to_end(cache_key)
+        if cached_pdf is not None:
+            with open(page_output_path, "wb") as f:
+                f.write(cached_pdf)
+            self.logger.debug(
+                f"Page {page_with_translation.page_number} restored from PDF cache"
+            )
+            return page_with_translation.page_number, page_output_path
+
         try:
-            page_copy = copy.deepcopy(page_with_translation)
+            # PDF生成リポジトリはページを変更しないため、コピーせずそのまま渡す
             self.pdf_generator_repository.generate_pdf_with_formula_id(
-                page=page_copy, output_path=page_output_path
+                page=page_with_translation, output_path=page_output_path
             )
-            return page_output_path
+            with open(page_output_path, "rb") as f:
+                pdf_bytes = f.read()
+            with self._page_pdf_cache_lock:
+                self._page_pdf_cache[cache_key] = pdf_bytes
+                if len(self._page_pdf_cache) > self._PAGE_PDF_CACHE_SIZE:
+                    self._page_pdf_cache.popitem(last=False)
+            return page_with_translation.page_number, page_output_path
         except Exception as e:
             self.logger.warning(
                 f"Error compiling page {page_with_translation.page_number}: {e}"
@@ -51,31 +84,42 @@ class GenerateTranslatedPDFWithFormulaIdUseCase:
             # TODO: エラー処理適切にしたい。空ページか、エラーが発生したのでPDF化できませんでした、という文言のPDFを出すか
             raise e
 
-    def _merge_pdfs(self, pdf_paths: List[str], output_path: str) -> str:
-        """PDFを結合する"""
-        merger = PdfMerger()
-        for pdf_path in sorted(
-            pdf_paths, key=lambda x: int(x.split("_")[-1].replace(".pdf", ""))
-        ):
-            merger.append(pdf_path)
-
+    @staticmethod
+    def _final_pdf_path(output_path: str) -> str:
+        """出力パスを.pdf付きのパスに正規化する"""
         if ".pdf" in output_path:
             output_basename = output_path.replace(".pdf", "")
         else:
             output_basename = output_path
+        return f"{output_basename}.pdf"
 
-        final_path = f"{output_basename}.pdf"
-        merger.write(final_path)
-        merger.close()
+    def _merge_pdfs(
+        self, pdf_entries: List[Tuple[int, str]], output_path: str
+    ) -> str:
+        """ページ番号順にPDFを結合する
+
+        Args:
+            pdf_entries (List[Tuple[int, str]]): (ページ番号, ページPDFのパス)のリスト
+            output_path (str): 出力パス
+        """
+        writer = PdfWriter()
+        for _, pdf_path in sorted(pdf_entries, key=itemgetter(0)):
+            writer.append(pdf_path)
+
+        final_path = self._final_pdf_path(output_path)
+        writer.write(final_path)
+        writer.close()
 
         return final_path
 
     def _remove_page_pdf(self, pdf_paths: List[str]) -> None:
-        # 一時ファイルを削除
+        # 一時ファイルを削除（既に無いファイルはリトライ等で起こり得るので無視する）
         for pdf_path in pdf_paths:
             try:
-                os.remove(pdf_path)
-            except Exception as e:
+                os.unlink(pdf_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
                 self.logger.warning(f"Failed to remove temporary file {pdf_path}: {e}")
 
     def execute(
@@ -96,42 +140,124 @@ class GenerateTranslatedPDFWithFormulaIdUseCase:
         Returns:
             tuple[str, list[str]]: 結合されたPDFのパス, ページごとのPDFのパスのリスト
         """
-        page_pdf_paths = []
+        pdf_entries: List[Tuple[int, str]] = []
+
+        # 結合はページ番号順にしか進められないため、完了したページを控えておき、
+        # 次に結合すべきページが揃った時点で逐次appendしてコンパイルの
+        # 残り時間と結合I/Oを重ね合わせる
+        writer = PdfWriter()
+        expected_page_numbers = sorted(
+            page.page_number for page in pages_with_translations
+        )
+        ready_paths: dict[int, str] = {}
+        merge_index = 0
 
         # 並列処理でページを処理
+        # （結合はどのみちページ番号順にしか進まないため、as_completedの
+        # 同期コストを払わず投入順にresult()で待つ）
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_page = {
-                executor.submit(self._process_page, page, output_path): page
+            page_futures = [
+                (page, executor.submit(self._process_page, page, output_path))
                 for page in pages_with_translations
-            }
+            ]
 
-            for future in as_completed(future_to_page):
-                page = future_to_page[future]
+            for page, future in page_futures:
                 try:
-                    page_pdf_path = future.result()
-                    page_pdf_paths.append(page_pdf_path)
+                    page_number, page_pdf_path = future.result()
                     self.logger.debug(f"Completed processing page {page.page_number}")
                 except Exception as e:
                     self.logger.warning(
                         f"Failed to process page {page.page_number}: {e}"
                     )
-                    page_output_path = (
+                    page_pdf_path = (
                         f"{output_path.replace('.pdf', '')}_{page.page_number}.pdf"
                     )
+                    page_number = page.page_number
                     self.error_pdf_generator_repository.generate_pdf_with_translation(
-                        page=page, output_path=page_output_path
+                        page=page, output_path=page_pdf_path
                     )
-                    self.logger.debug(f"Generated error PDF at {page_output_path}")
-                    page_pdf_paths.append(page_output_path)
+                    self.logger.debug(f"Generated error PDF at {page_pdf_path}")
+                pdf_entries.append((page_number, page_pdf_path))
+                ready_paths[page_number] = page_pdf_path
+                while (
+                    merge_index < len(expected_page_numbers)
+                    and expected_page_numbers[merge_index] in ready_paths
+                ):
+                    writer.append(ready_paths[expected_page_numbers[merge_index]])
+                    merge_index += 1
         # すべてのPDFを結合
-        if not page_pdf_paths:
+        if not pdf_entries:
+            writer.close()
             raise Exception("No pages were successfully processed")
 
-        final_path = self._merge_pdfs(page_pdf_paths, output_path)
+        final_path = self._final_pdf_path(output_path)
+        writer.write(final_path)
+        writer.close()
         self.logger.debug(f"Successfully created merged PDF at {final_path}")
 
+        page_pdf_paths = [pdf_path for _, pdf_path in pdf_entries]
         # 中間ファイルを保存しない場合、ページごとのPDFを削除
         if not save_page_file:
             self._remove_page_pdf(page_pdf_paths)
 
         return final_path, page_pdf_paths
+
+    async def execute_async(
+        self,
+        pages_with_translations: List[PageWithTranslation],
+        output_path: str,
+        save_page_file: bool = False,
+    ) -> tuple[str, list[str]]:
+        """ページごとのPDF生成を非同期で行い、PDFを生成する
+
+        コンパイル自体はサブプロセス（latexmk）なので、スレッドへ逃がして
+        イベントループを塞がずにページを並列処理する。失敗したページは
+        executeと同様にエラー用リポジトリでフォールバック生成する。
+
+        Args:
+            pages_with_translations (List[PageWithTranslation]): 翻訳されたページのリスト
+            output_path (str): 出力パス.
+            save_page_file (bool, optional): ページごとのPDFを保存するかどうか. デフォルトはFalse.
+
+        Returns:
+            tuple[str, list[str]]: 結合されたPDFのパス, ページごとのPDFのパスのリスト
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def process_page(page: PageWithTranslation) -> Tuple[int, str]:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(
+                        self._process_page, page, output_path
+                    )
+                except Exception as e:
+                    self.logger.warning(
+                        f"Failed to process page {page.page_number}: {e}"
+                    )
+                    page_output_path = (
+                        f"{output_path.replace('.pdf', '')}_{page.page_number}.pdf"
+                    )
+                    await asyncio.to_thread(
+                        self.error_pdf_generator_repository.generate_pdf_with_translation,
+                        page,
+                        page_output_path,
+                    )
+                    self.logger.debug(f"Generated error PDF at {page_output_path}")
+                    return page.page_number, page_output_path
+
+        pdf_entries = list(
+            await asyncio.gather(
+                *[process_page(page) for page in pages_with_translations]
+            )
+        )
+        if not pdf_entries:
+            raise Exception("No pages were successfully processed")
+
+        final_path = self._merge_pdfs(pdf_entries, output_path)
+        self.logger.debug(f"Successfully created merged PDF at {final_path}")
+
+        page_pdf_paths = [pdf_path for _, pdf_path in pdf_entries]
+        if not save_page_file:
+            self._remove_page_pdf(page_pdf_paths)
+
+        return final_path, page_pdf_paths
@@ -1,17 +1,27 @@
 import asyncio
+import hashlib
+import heapq
+import os
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
 from logging import INFO, StreamHandler, getLogger
 from typing import List, Tuple
 
+from ocr_module.domain.entities import Paragraph, ParagraphWithTranslation
+
 from ocr_module.domain.entities import (
     Section,
     SectionWithTranslation,
     TranslationUsageStatsConfig,
 )
 from ocr_module.domain.repositories import ITranslateSectionRepository
+from ocr_module.utils import AsyncRateLimiter
 from dataclasses import dataclass
 
+# セクションログの区切り線（毎回 "=" * 30 を組み立てない）
+_SEP = "=" * 30
+
+
 @dataclass
 class TranslateSectionFormulaIdResult:
     """
@@ -28,13 +38,122 @@ class TranslateSectionFormulaIdResult:
 class TranslateSectionFormulaIdUseCase:
     """Sectionの内容を翻訳する（数式ID付き）"""
 
-    def __init__(self, translate_section_repository: ITranslateSectionRepository):
+    # 翻訳結果キャッシュ（content列ハッシュ -> 翻訳文字列のリスト）の保持件数
+    _TRANSLATION_CACHE_SIZE = 1024
+    # 段落単位の翻訳キャッシュ（繰り返しのヘッダ・フッタ・定型文向け）の保持件数
+    _PARAGRAPH_CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        translate_section_repository: ITranslateSectionRepository,
+        max_concurrency: int | None = None,
+        requests_per_minute: float | None = None,
+    ):
+        """TranslateSectionFormulaIdUseCaseの初期化
+
+        Args:
+            translate_section_repository (ITranslateSectionRepository): 翻訳リポジトリ
+            max_concurrency (int | None): 同時に投げるAPIリクエスト数の上限
+                （Noneなら環境変数TRANSLATE_CONCURRENCY、未設定なら8）
+            requests_per_minute (float | None): 毎分リクエスト数の上限
+                （プロバイダのRPM制限に合わせる。Noneなら間隔制限なし）
+        """
         self._translate_section_repository = translate_section_repository
+        self._translation_cache: "OrderedDict[str, List[str | None]]" = OrderedDict()
+        self._paragraph_translation_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._max_concurrency = (
+            max_concurrency
+            if max_concurrency is not None
+            else int(os.getenv("TRANSLATE_CONCURRENCY", "8"))
+        )
+        self._requests_per_minute = requests_per_minute
+        self._rate_limiter: AsyncRateLimiter | None = None
+        self._rate_limiter_loop: "asyncio.AbstractEventLoop | None" = None
         self._logger = getLogger(__name__)
         if not self._logger.hasHandlers():
             self._logger.setLevel(INFO)
             self._logger.addHandler(StreamHandler())
 
+    def _get_rate_limiter(self) -> AsyncRateLimiter:
+        """実行中のイベントループに束縛されたレートリミッタを返す
+
+        asyncioの同期プリミティブは最初に使われたループに束縛されるため、
+        executeがasyncio.runを繰り返してもインスタンスを使い回せるよう、
+        ループが変わったら作り直す。
+        """
+        loop = asyncio.get_running_loop()
+        if self._rate_limiter is None or self._rate_limiter_loop is not loop:
+            self._rate_limiter = AsyncRateLimiter(
+                max_concurrency=self._max_concurrency,
+                requests_per_minute=self._requests_per_minute,
+            )
+            self._rate_limiter_loop = loop
+        return self._rate_limiter
+
+    @staticmethod
+    def _cache_key(
+        paragraphs: List[Paragraph],
+        source_language: str | None,
+        target_language: str,
+    ) -> str:
+        """チャンクの内容と言語ペアからキャッシュキーを計算する"""
+        digest = hashlib.sha256()
+        digest.update(f"{source_language}\x00{target_language}".encode("utf-8"))
+        for paragraph in paragraphs:
+            digest.update(b"\x00")
+            digest.update(paragraph.content.encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _paragraph_cache_key(
+        content: str,
+        source_language: str | None,
+        target_language: str,
+    ) -> bytes:
+        """段落の内容と言語ペアからキャッシュキーを計算する"""
+        return hashlib.blake2b(
+            f"{source_language}\x00{target_language}\x00{content}".encode("utf-8"),
+            digest_size=16,
+        ).digest()
+
+    def _get_cached_paragraph_translation(
+        self,
+        paragraph: Paragraph,
+        source_language: str | None,
+        target_language: str,
+    ) -> str | None:
+        """段落単位キャッシュから訳文を引く（無ければNone）"""
+        key = self._paragraph_cache_key(
+            paragraph.content, source_language, target_language
+        )
+        translation = self._paragraph_translation_cache.get(key)
+        if translation is not None:
+            self._paragraph_translation_cache.move_to_end(key)
+        return translation
+
+    def _store_translations(
+        self,
+        cache_key: str,
+        translated: List[ParagraphWithTranslation],
+        source_language: str | None,
+        target_language: str,
+    ) -> None:
+        """翻訳済みチャンクの訳文をチャンク・段落両方のキャッシュに登録する"""
+        self._translation_cache[cache_key] = [
+            paragraph.translation for paragraph in translated
+        ]
+        if len(self._translation_cache) > self._TRANSLATION_CACHE_SIZE:
+            self._translation_cache.popitem(last=False)
+        for paragraph in translated:
+            if paragraph.translation is None:
+                continue
+            key = self._paragraph_cache_key(
+                paragraph.content, source_language, target_language
+            )
+            self._paragraph_translation_cache[key] = paragraph.translation
+            if len(self._paragraph_translation_cache) > self._PARAGRAPH_CACHE_SIZE:
+                self._paragraph_translation_cache.popitem(last=False)
+
     def execute(
         self,
         sections: List[Section],
@@ -43,6 +162,11 @@ class TranslateSectionFormulaIdUseCase:
     ) -> TranslateSectionFormulaIdResult:
         """Sectionの内容を翻訳する（数式ID付き）
 
+        execute_asyncへの同期ラッパー。スレッドプールで無制限に投げる代わりに
+        イベントループ上で実行し、同時実行数・レート制限・キャッシュ・
+        重複排除を非同期経路と共有する。実行中のイベントループ内からは
+        execute_asyncを直接awaitすること。
+
         Args:
             sections (List[Section]): 翻訳するSectionのリスト
             source_language (str | None): 翻訳元の言語(None means auto translate)
@@ -51,31 +175,18 @@ class TranslateSectionFormulaIdUseCase:
         Returns:
             TranslateSectionFormulaIdResult: 翻訳されたSectionWithTranslationのリストと使用統計情報
         """
-        section_with_translations: List[SectionWithTranslation] = []
-        usage_stats: TranslationUsageStatsConfig = TranslationUsageStatsConfig()
-        with ThreadPoolExecutor() as executor:
-            futures = [
-                executor.submit(
-                    self._translate_section_repository.translate_section_with_formula_id,
-                    section,
-                    source_language,
-                    target_language,
-                )
-                for section in sections
-            ]
-            for future in as_completed(futures):
-                section_with_translation, section_usage_stats = future.result()
-                section_with_translations.append(section_with_translation)
-                # usage_stats を更新する
-                usage_stats.model_name = section_usage_stats.model_name
-                usage_stats.version = section_usage_stats.version
-                usage_stats.api_endpoint = section_usage_stats.api_endpoint
-                usage_stats.billed_characters_count += section_usage_stats.billed_characters_count
-                usage_stats.input_tokens_count += section_usage_stats.input_tokens_count
-                usage_stats.output_tokens_count += section_usage_stats.output_tokens_count
-        return TranslateSectionFormulaIdResult(
-            sections=section_with_translations,
-            usage_stats=usage_stats,
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # asyncio.runのRuntimeErrorより原因の分かるメッセージで落とす
+            raise RuntimeError(
+                "execute() cannot be called from a running event loop; "
+                "await execute_async() instead"
+            )
+        return asyncio.run(
+            self.execute_async(sections, source_language, target_language)
         )
 
     async def execute_async(
@@ -95,110 +206,357 @@ class TranslateSectionFormulaIdUseCase:
             TranslateSectionFormulaIdResult: 翻訳されたセクションと使用統計情報
         """
         LIMIT = 1500
+        # これ以下の文字数のセクションは1リクエストにまとめて送る
+        SMALL_SECTION_LIMIT = 300
         usage_stats = TranslationUsageStatsConfig()
+        rate_limiter = self._get_rate_limiter()
+
+        # 同一内容・同一言語ペアのチャンクはキャッシュから復元し、
+        # APIには未知のチャンクだけを投げる
+        async def translate_chunk(
+            paras: List[Paragraph],
+        ) -> Tuple[List[ParagraphWithTranslation], TranslationUsageStatsConfig]:
+            cache_key = self._cache_key(paras, source_language, target_language)
+            cached = self._translation_cache.get(cache_key)
+            if cached is not None:
+                self._translation_cache.move_to_end(cache_key)
+                restored = [
+                    ParagraphWithTranslation(
+                        paragraph_id=paragraph.paragraph_id,
+                        role=paragraph.role,
+                        content=paragraph.content,
+                        bbox=paragraph.bbox,
+                        page_number=paragraph.page_number,
+                        translation=translation,
+                    )
+                    for paragraph, translation in zip(paras, cached)
+                ]
+                return restored, TranslationUsageStatsConfig()
+            # プロバイダのレート制限に合わせて送信を平準化する
+            async with rate_limiter:
+                translated, stats = (
+                    await self._translate_section_repository.translate_paragraphs_with_formula_id_async(
+                        paras,
+                        source_language,
+                        target_language,
+                    )
+                )
+            self._store_translations(
+                cache_key, translated, source_language, target_language
+            )
+            return translated, stats
 
         async def get_result_task(
             section: Section,
         ) -> Tuple[SectionWithTranslation, TranslationUsageStatsConfig]:
-            # logging
+            # logging（ハンドラがINFOを落とす設定なら整形自体を省く）
             start_time = time.time()
+            log_enabled = self._logger.isEnabledFor(INFO)
             i = f"{section.section_id:03d}"
-            self._logger.info(f"[{i}]" + "=" * 30)
-            self._logger.info(f"[{i}]  start translate_section_with_formula_id")
+            if log_enabled:
+                self._logger.info("[%s]%s", i, _SEP)
+                self._logger.info("[%s]  start translate_section_with_formula_id", i)
 
             section_usage_stats = TranslationUsageStatsConfig()
 
-            if section.content_length() == 0:
-                self._logger.info(f"[{i}]  content length is 0")
-                ret = SectionWithTranslation(
-                    section_id=section.section_id,
-                    paragraphs=[],  # 空のリストを渡す
-                    paragraph_ids=section.paragraph_ids,
-                    table_ids=section.table_ids,
-                    figure_ids=section.figure_ids,
-                    tables=section.tables,
-                    figures=section.figures,
-                )
-                return ret, section_usage_stats
+            # content_length()は段落を毎回走査するため、1回だけ計算して使い回す
+            total_length = section.content_length()
+            if total_length == 0:
+                if log_enabled:
+                    self._logger.info("[%s]  content length is 0", i)
+                para_rets: List[ParagraphWithTranslation] = []
             else:
-                # paragraphs を chunk に分割する
-                para_list = []
-                current_paragraphs = []
-                current_length = 0
+                # 段落単位キャッシュに当たったもの（繰り返しのヘッダ等）は
+                # 送信対象から外し、未訳の段落だけをチャンクに詰める
+                cached_rets: List[Tuple[int, ParagraphWithTranslation]] = []
+                miss_paragraphs: List[Tuple[int, Paragraph]] = []
+                for index, paragraph in enumerate(section.paragraphs):
+                    cached_translation = self._get_cached_paragraph_translation(
+                        paragraph, source_language, target_language
+                    )
+                    if cached_translation is not None:
+                        cached_rets.append(
+                            (
+                                index,
+                                ParagraphWithTranslation(
+                                    paragraph.paragraph_id,
+                                    paragraph.role,
+                                    paragraph.content,
+                                    paragraph.bbox,
+                                    paragraph.page_number,
+                                    cached_translation,
+                                ),
+                            )
+                        )
+                    else:
+                        miss_paragraphs.append((index, paragraph))
 
-                for paragraph in section.paragraphs:
-                    paragraph_len = paragraph.content_length()
-                    if current_length + paragraph_len > LIMIT and current_paragraphs:
-                        para_list.append(current_paragraphs)
-                        current_paragraphs = []
-                        current_length = 0
-                    current_paragraphs.append(paragraph)
-                    current_length += paragraph_len
+                # セクション内で同一contentの段落（段組ごとに繰り返される
+                # 定型文やキャプション等）は最初の1つだけを送信対象にし、
+                # 訳文は翻訳後に残りへ展開する
+                first_index_by_content: dict[str, int] = {}
+                unique_paragraphs: List[Tuple[int, Paragraph]] = []
+                duplicate_paragraphs: List[Tuple[int, Paragraph]] = []
+                for index, paragraph in miss_paragraphs:
+                    first_index = first_index_by_content.setdefault(
+                        paragraph.content, index
+                    )
+                    if first_index == index:
+                        unique_paragraphs.append((index, paragraph))
+                    else:
+                        duplicate_paragraphs.append((index, paragraph))
 
-                # 残りのparagraphsがある場合、最後のチャンクを作成
-                if current_paragraphs:
-                    para_list.append(current_paragraphs)
+                # paragraphs を chunk に分割する。先頭から順に詰める貪欲法は
+                # 末尾に小さなチャンクを量産するため、LPT（長い段落から、
+                # 残り容量が最も大きいビンへ）でリクエスト数を減らす。
+                # 段落長はソートキーとビン詰めの両方で使うため、先に1回だけ計算する
+                measured_paragraphs = sorted(
+                    (
+                        (paragraph.content_length(), index, paragraph)
+                        for index, paragraph in unique_paragraphs
+                    ),
+                    key=lambda triple: triple[0],
+                    reverse=True,
+                )
+                bin_indices: List[List[int]] = []
+                bin_paragraphs: List[List[Paragraph]] = []
+                load_heap: List[Tuple[int, int]] = []  # (使用文字数, ビン番号)
+                for paragraph_len, index, paragraph in measured_paragraphs:
+                    if load_heap and load_heap[0][0] + paragraph_len <= LIMIT:
+                        load, bin_number = heapq.heappop(load_heap)
+                        bin_indices[bin_number].append(index)
+                        bin_paragraphs[bin_number].append(paragraph)
+                        heapq.heappush(load_heap, (load + paragraph_len, bin_number))
+                    else:
+                        # どのビンにも収まらない場合は新しいビンを開く
+                        # （LIMITを超える単一段落もそのまま1ビンで送る）
+                        bin_number = len(bin_paragraphs)
+                        bin_indices.append([index])
+                        bin_paragraphs.append([paragraph])
+                        heapq.heappush(load_heap, (paragraph_len, bin_number))
+
+                # 分割した paragraph を翻訳する。gatherで全ビンの完了を
+                # まとめて待つ代わりに、as_completedで終わったビンから順に
+                # 所定のスロットへ書き戻し、一番遅いビンを待つ間に
+                # 再整列と統計集計を済ませておく
+                async def translate_bin(
+                    bin_number: int, paras: List[Paragraph]
+                ) -> Tuple[
+                    int, List[ParagraphWithTranslation], TranslationUsageStatsConfig
+                ]:
+                    translated, stats = await translate_chunk(paras)
+                    return bin_number, translated, stats
+
+                ordered_rets: List[ParagraphWithTranslation | None] = [None] * len(
+                    section.paragraphs
+                )
+                for original_index, translated in cached_rets:
+                    ordered_rets[original_index] = translated
 
-                # 分割した paragraph を翻訳する
                 tasks = [
-                    asyncio.to_thread(
-                        self._translate_section_repository.translate_paragraphs_with_formula_id,
-                        paras,
-                        source_language,
-                        target_language,
-                    )
-                    for paras in para_list
+                    translate_bin(bin_number, paras)
+                    for bin_number, paras in enumerate(bin_paragraphs)
                 ]
-                para_results = await asyncio.gather(*tasks)
-
-                # 翻訳結果と使用統計を集計
-                para_rets = []
-                for paras, stats in para_results:
-                    para_rets.extend(paras)
+                for future in asyncio.as_completed(tasks):
+                    bin_number, paras, stats = await future
+                    for original_index, translated in zip(
+                        bin_indices[bin_number], paras
+                    ):
+                        ordered_rets[original_index] = translated
                     # 使用統計を更新
-                    section_usage_stats.model_name = stats.model_name
-                    section_usage_stats.version = stats.version
-                    section_usage_stats.api_endpoint = stats.api_endpoint
-                    section_usage_stats.billed_characters_count += stats.billed_characters_count
-                    section_usage_stats.input_tokens_count += stats.input_tokens_count
-                    section_usage_stats.output_tokens_count += stats.output_tokens_count
-
-                ret = SectionWithTranslation(
-                    section_id=section.section_id,
-                    paragraphs=para_rets,
-                    paragraph_ids=section.paragraph_ids,
-                    table_ids=section.table_ids,
-                    figure_ids=section.figure_ids,
-                    tables=section.tables,
-                    figures=section.figures,
+                    section_usage_stats.add(stats)
+
+                # 重複していた段落へ代表の訳文を展開する
+                for index, paragraph in duplicate_paragraphs:
+                    source = ordered_rets[first_index_by_content[paragraph.content]]
+                    if source is None:
+                        continue
+                    ordered_rets[index] = ParagraphWithTranslation(
+                        paragraph_id=paragraph.paragraph_id,
+                        role=paragraph.role,
+                        content=paragraph.content,
+                        bbox=paragraph.bbox,
+                        page_number=paragraph.page_number,
+                        translation=source.translation,
+                    )
+                para_rets = [ret for ret in ordered_rets if ret is not None]
+
+            # 構築は分岐ごとに繰り返さず、段落が決まった後に1箇所で行う
+            ret = SectionWithTranslation.from_section(section, para_rets)
+
+            if log_enabled:
+                self._logger.info(
+                    "[%s]  %d paragraphs of %s chars",
+                    i,
+                    len(section.paragraphs),
+                    f"{total_length:,}",
+                )
+                self._logger.info("[%s]  end translate_section_with_formula_id", i)
+                self._logger.info(
+                    "[%s]  elapsed time: %.2f sec", i, time.time() - start_time
+                )
+                self._logger.info("[%s]%s", i, _SEP)
+            return ret, section_usage_stats
+
+        # 同一内容のセクション（繰り返しのヘッダやキャプション等）は
+        # 代表1つだけを翻訳し、結果を残りへ展開する
+        section_groups: dict[str, List[Section]] = {}
+        for section in sections:
+            key = self._cache_key(section.paragraphs, source_language, target_language)
+            section_groups.setdefault(key, []).append(section)
+        representatives = [group[0] for group in section_groups.values()]
+
+        # 小さいセクション（キャプションや見出し等）は1セクション=1リクエストだと
+        # プロンプトのprefix分のトークンとHTTP往復を毎回払うため、
+        # LIMIT文字までまとめて1チャンクとして送り、結果をセクション別に戻す
+        async def translate_pack(
+            pack: List[Section],
+        ) -> List[Tuple[SectionWithTranslation, TranslationUsageStatsConfig]]:
+            paragraphs = [
+                paragraph for section in pack for paragraph in section.paragraphs
+            ]
+            translated, stats = await translate_chunk(paragraphs)
+            pack_results = []
+            offset = 0
+            for section in pack:
+                count = len(section.paragraphs)
+                pack_results.append(
+                    (
+                        SectionWithTranslation.from_section(
+                            section, translated[offset : offset + count]
+                        ),
+                        # 使用統計はパック先頭のセクションに計上する
+                        stats if offset == 0 else TranslationUsageStatsConfig(),
+                    )
                 )
+                offset += count
+            return pack_results
 
-            self._logger.info(
-                f"[{i}]  {len(section.paragraphs)} paragraphs of {section.content_length():,} chars"
-            )
-            self._logger.info(f"[{i}]  end translate_section_with_formula_id")
-            self._logger.info(
-                f"[{i}]  elapsed time: {time.time() - start_time:.2f} sec"
+        # 振り分け・パック詰め・ソートで3回走査しないよう、セクション長を先に測る
+        section_lengths = {
+            id(section): section.content_length() for section in representatives
+        }
+        # 空のセクション（図表のみ等）はタスクとしてスケジュールせず、
+        # ここで同期的に空の結果を作る
+        empty_results = [
+            (SectionWithTranslation.from_section(section, []), TranslationUsageStatsConfig())
+            for section in representatives
+            if section_lengths[id(section)] == 0
+        ]
+        small_sections = [
+            section
+            for section in representatives
+            if 0 < section_lengths[id(section)] <= SMALL_SECTION_LIMIT
+        ]
+        large_sections = [
+            section
+            for section in representatives
+            if section_lengths[id(section)] > SMALL_SECTION_LIMIT
+        ]
+
+        packs: List[List[Section]] = []
+        current_pack: List[Section] = []
+        current_length = 0
+        for section in small_sections:
+            section_length = section_lengths[id(section)]
+            if current_length + section_length > LIMIT and current_pack:
+                packs.append(current_pack)
+                current_pack = []
+                current_length = 0
+            current_pack.append(section)
+            current_length += section_length
+        if current_pack:
+            packs.append(current_pack)
+
+        def fallback_section(section: Section) -> SectionWithTranslation:
+            """翻訳に失敗したセクションを原文のまま返す"""
+            return SectionWithTranslation.from_section(
+                section,
+                [
+                    ParagraphWithTranslation(
+                        paragraph_id=paragraph.paragraph_id,
+                        role=paragraph.role,
+                        content=paragraph.content,
+                        bbox=paragraph.bbox,
+                        page_number=paragraph.page_number,
+                        translation=paragraph.content,
+                    )
+                    for paragraph in section.paragraphs
+                ],
             )
-            self._logger.info(f"[{i}]" + "=" * 30)
-            return ret, section_usage_stats
 
         # contentが多い順にrequestを投げる
-        sections.sort(key=lambda x: x.content_length(), reverse=True)
-        tasks = [get_result_task(section) for section in sections]
-        results = await asyncio.gather(*tasks)
+        large_sections.sort(key=lambda x: section_lengths[id(x)], reverse=True)
+        section_tasks = [get_result_task(section) for section in large_sections]
+        pack_tasks = [translate_pack(pack) for pack in packs]
+        gathered = await asyncio.gather(
+            *section_tasks, *pack_tasks, return_exceptions=True
+        )
+
+        # 散発的なセクション失敗でドキュメント全体を失わないよう、
+        # 失敗したセクションは原文を訳文として返して処理を続行する
+        failed_section_count = 0
+        representative_results = list(empty_results)
+        units: List[List[Section]] = [[section] for section in large_sections] + packs
+        for unit, item in zip(units, gathered):
+            if isinstance(item, BaseException):
+                failed_section_count += len(unit)
+                self._logger.error(
+                    "Translation failed for sections %s, falling back to source text: %s",
+                    [section.section_id for section in unit],
+                    item,
+                )
+                for section in unit:
+                    representative_results.append(
+                        (fallback_section(section), TranslationUsageStatsConfig())
+                    )
+            elif isinstance(item, list):
+                representative_results.extend(item)
+            else:
+                representative_results.append(item)
+
+        result_by_section_id = {
+            section_result.section_id: (section_result, section_stats)
+            for section_result, section_stats in representative_results
+        }
+        results = []
+        for group in section_groups.values():
+            rep_result, rep_stats = result_by_section_id[group[0].section_id]
+            results.append((rep_result, rep_stats))
+            translations = [
+                paragraph.translation for paragraph in rep_result.paragraphs
+            ]
+            for section in group[1:]:
+                results.append(
+                    (
+                        SectionWithTranslation.from_section(
+                            section,
+                            [
+                                ParagraphWithTranslation(
+                                    paragraph_id=paragraph.paragraph_id,
+                                    role=paragraph.role,
+                                    content=paragraph.content,
+                                    bbox=paragraph.bbox,
+                                    page_number=paragraph.page_number,
+                                    translation=translation,
+                                )
+                                for paragraph, translation in zip(
+                                    section.paragraphs, translations
+                                )
+                            ],
+                        ),
+                        TranslationUsageStatsConfig(),
+                    )
+                )
 
         # 結果と使用統計を分離
         sections_with_translation = []
         for section_result, section_stats in results:
             sections_with_translation.append(section_result)
             # 全体の使用統計を更新
-            usage_stats.model_name = section_stats.model_name
-            usage_stats.version = section_stats.version
-            usage_stats.api_endpoint = section_stats.api_endpoint
-            usage_stats.billed_characters_count += section_stats.billed_characters_count
-            usage_stats.input_tokens_count += section_stats.input_tokens_count
-            usage_stats.output_tokens_count += section_stats.output_tokens_count
+            usage_stats.add(section_stats)
+
+        usage_stats.failed_sections_count = failed_section_count
 
         # セクションIDでソート
         sections_with_translation.sort(key=lambda x: x.section_id)
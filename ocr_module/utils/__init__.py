@@ -0,0 +1,4 @@
+from .concurrency import default_worker_count
+from .logger import setup_function_logger
+from .rate_limit import AsyncRateLimiter
+from .retry import is_transient_error, retry_transient
@@ -0,0 +1,20 @@
+import os
+
+
+def default_worker_count(cap: int = 6) -> int:
+    """並列処理のデフォルトワーカー数を決定する
+
+    コンテナ環境（cgroupでCPU制限されたk8s/Dockerなど）では`os.cpu_count()`が
+    ホストのCPU数を返してしまうため、利用可能なCPUのaffinityから算出する。
+
+    Args:
+        cap (int, optional): ワーカー数の上限. Defaults to 6.
+
+    Returns:
+        int: ワーカー数（1以上cap以下）
+    """
+    if hasattr(os, "sched_getaffinity"):
+        available = len(os.sched_getaffinity(0))
+    else:
+        available = os.cpu_count() or 1
+    return max(1, min(available, cap))
@@ -1,17 +1,39 @@
-import os
+import atexit
 import logging
-import time
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+# 関数名 -> 稼働中のQueueListener（再セットアップ時の停止とatexitでのflush用）
+_listeners: dict[str, QueueListener] = {}
+
+
+def _stop_listeners() -> None:
+    """稼働中のリスナーを停止し、キューに残ったレコードをflushする"""
+    for listener in _listeners.values():
+        listener.stop()
+    _listeners.clear()
+
+
+atexit.register(_stop_listeners)
+
 
 def setup_function_logger(function_name: str) -> logging.Logger:
-    """関数ごとの実行時間ロガーを設定"""
+    """関数ごとの実行時間ロガーを設定
+
+    ファイルへの書き込みはQueueListenerの専用スレッドに逃がし、
+    ログ呼び出し側（翻訳のディスパッチスレッド等）がディスクI/Oで
+    ブロックしないようにする。
+    """
     logger = logging.getLogger(f"performance.{function_name}")
     logger.setLevel(logging.INFO)
 
     # 既存のハンドラをクリア
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    previous_listener = _listeners.pop(function_name, None)
+    if previous_listener is not None:
+        previous_listener.stop()
 
     # ログディレクトリ作成
     log_dir = Path("logs/performance")
@@ -24,12 +46,21 @@ def setup_function_logger(function_name: str) -> logging.Logger:
     if log_file.exists():
         log_file.unlink()
 
-    # CSVファイル用のハンドラを作成
-    handler = logging.FileHandler(log_file)
+    # CSVファイル用のハンドラを作成（delay=Trueで最初のレコードまで開かない）
+    file_handler = logging.FileHandler(log_file, delay=True)
     formatter = logging.Formatter(
         "%(asctime)s,%(message)s", datefmt="%Y-%m-%d %H:%M:%S"
     )
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    file_handler.setFormatter(formatter)
+
+    # ロガーにはQueueHandlerだけを付け、書き込みはリスナースレッドに任せる
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    _listeners[function_name] = listener
+
+    logger.addHandler(QueueHandler(log_queue))
+    # rootハンドラに伝播して二重に整形・出力されるのを防ぐ
+    logger.propagate = False
 
     return logger
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from logging import getLogger
+
+_logger = getLogger(__name__)
+
+# エラーメッセージからのレート制限判定に使うマーカー
+# （SDK例外がstatus_codeを持たない場合のフォールバック）
+_RATE_LIMIT_MARKERS = ("429", "rate limit", "quota")
+
+
+def _is_rate_limit_error(error: BaseException) -> bool:
+    """レート制限（HTTP 429相当）による失敗かどうかを判定する
+
+    Args:
+        error (BaseException): 判定対象の例外
+
+    Returns:
+        bool: レート制限によるエラーならTrue
+    """
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code == 429
+    message = str(error).lower()
+    return any(marker in message for marker in _RATE_LIMIT_MARKERS)
+
+
+class AsyncRateLimiter:
+    """同時実行数と毎分リクエスト数を制限する非同期コンテキストマネージャ
+
+    翻訳APIのようにRPM上限のあるサービスへfan-outする際、同時実行数を
+    抑えつつ、トークンバケット方式でリクエストの開始間隔を空ける。
+    429とその再送によるスループット低下を、送信側で平準化して避けるのが目的。
+
+    同時実行数の上限は固定ではなくAIMD（加算増加・乗算減少）で調整する。
+    コンテキスト内から429相当の例外が送出されたら上限を半分に下げ
+    （他のワークロードとクォータを共有している状況に追従する）、上限で
+    成功が続いたら1ずつ設定値まで戻す。admission管理はsemaphoreではなく
+    Condition上のカウンタで行い、上限の増減を待機者へ安全に反映する。
+
+    Args:
+        max_concurrency (int): 同時に実行するリクエスト数の上限
+            （初期値であり、回復時に戻る上限でもある）
+        requests_per_minute (float | None): 毎分のリクエスト数上限
+            （Noneの場合は間隔制限なし）
+    """
+
+    # 上限を1増やすまでに必要な連続成功数
+    _INCREASE_AFTER = 16
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        requests_per_minute: float | None = None,
+    ):
+        self._max_concurrency = max_concurrency
+        self._limit = max_concurrency
+        self._in_flight = 0
+        self._success_streak = 0
+        self._condition = asyncio.Condition()
+        self._interval = (
+            60.0 / requests_per_minute if requests_per_minute else 0.0
+        )
+        self._next_slot = 0.0
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+            if self._interval:
+                now = time.monotonic()
+                wait = self._next_slot - now
+                self._next_slot = max(now, self._next_slot) + self._interval
+            else:
+                wait = 0.0
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            freed_slots = 1
+            if exc is not None and _is_rate_limit_error(exc):
+                # 乗算減少: リトライしても429が貫通した＝実効クォータは
+                # 現在の上限より小さいとみなして半分に絞る
+                lowered = max(1, self._limit // 2)
+                if lowered < self._limit:
+                    _logger.warning(
+                        "Rate limited; lowering concurrency limit %d -> %d",
+                        self._limit,
+                        lowered,
+                    )
+                    self._limit = lowered
+                self._success_streak = 0
+            elif exc is None:
+                # 加算増加: 成功が続いたら設定値まで1ずつ戻す
+                self._success_streak += 1
+                if (
+                    self._limit < self._max_concurrency
+                    and self._success_streak >= self._INCREASE_AFTER
+                ):
+                    self._limit += 1
+                    self._success_streak = 0
+                    # 解放したスロットに加えて、引き上げで生まれた空きの分も起こす
+                    freed_slots += 1
+                    _logger.info(
+                        "Raising concurrency limit to %d", self._limit
+                    )
+            self._condition.notify(freed_slots)
@@ -0,0 +1,111 @@
+import random
+import time
+from logging import Logger, getLogger
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+_logger = getLogger(__name__)
+
+# エラーメッセージからの一時的エラー判定に使うマーカー
+# （SDK例外がstatus_codeを持たない場合のフォールバック）
+_TRANSIENT_MARKERS = (
+    "429",
+    "rate limit",
+    "quota",
+    "timeout",
+    "timed out",
+    "connection",
+    "service unavailable",
+    "server error",
+    "overloaded",
+)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """再試行する価値のある一時的なエラーかどうかを判定する
+
+    429（レート制限）と5xx系のサーバエラー、タイムアウト・接続エラーを
+    一時的とみなす。認証エラーや不正リクエストなどはFalseを返し、
+    呼び出し側で即時に失敗させる。
+
+    Args:
+        error (BaseException): 判定対象の例外
+
+    Returns:
+        bool: 一時的なエラーならTrue
+    """
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code == 429 or status_code >= 500
+    message = str(error).lower()
+    return any(marker in message for marker in _TRANSIENT_MARKERS)
+
+
+def _retry_after_seconds(error: BaseException) -> float | None:
+    """例外からRetry-Afterの秒数を取り出す（見つからなければNone）
+
+    SDK例外が直接retry_after属性を持つ場合と、HTTPレスポンスの
+    Retry-Afterヘッダに入っている場合の両方を見る。
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is None:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is not None:
+            retry_after = headers.get("Retry-After")
+    if retry_after is None:
+        return None
+    try:
+        return float(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_transient(
+    func: Callable[[], T],
+    retry_limit: int = 3,
+    initial_delay: float = 2.0,
+    max_delay: float = 30.0,
+    logger: Logger | None = None,
+) -> T:
+    """一時的なエラーに限り指数バックオフで再試行しながらfuncを実行する
+
+    待ち時間はinitial_delayから始めて試行ごとに2倍し、max_delayで頭打ちに
+    する。同時リトライの衝突を避けるためジッタを加える。サーバが
+    Retry-Afterを返した場合は推測せずその秒数だけ待つ。一時的でない
+    エラーは再試行せずそのまま送出する。
+
+    Args:
+        func (Callable[[], T]): 実行する関数（引数なし）
+        retry_limit (int): 最大試行回数
+        initial_delay (float): 初回の待ち時間（秒）
+        max_delay (float): 待ち時間の上限（秒）
+        logger (Logger | None): 警告ログの出力先（Noneならこのモジュールのlogger）
+
+    Returns:
+        T: funcの戻り値
+    """
+    log = logger or _logger
+    delay = initial_delay
+    for attempt in range(1, retry_limit + 1):
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= retry_limit or not is_transient_error(e):
+                raise
+            retry_after = _retry_after_seconds(e)
+            if retry_after is not None:
+                wait = retry_after
+            else:
+                wait = delay * random.uniform(0.5, 1.5)
+            log.warning(
+                "Transient error (attempt %d/%d), retrying in %.1fs: %s",
+                attempt,
+                retry_limit,
+                wait,
+                e,
+            )
+            time.sleep(wait)
+            delay = min(delay * 2, max_delay)
+    raise AssertionError("unreachable")